@@ -0,0 +1,150 @@
+""" Kameleoon OpenFeature """
+import threading
+import time
+from typing import Callable, Optional
+
+
+class CircuitBreaker:
+    """
+    CircuitBreaker short-circuits flag evaluations while the Kameleoon SDK is degraded.
+
+    After `failure_threshold` consecutive failed evaluations the circuit opens, and evaluations return the
+    default value immediately. Once `recovery_timeout_seconds` have passed, the probe is run in a background
+    thread; if it succeeds the circuit becomes half-open and a single trial evaluation is let through, which
+    closes the circuit on success or opens it again on failure. Without a probe, the trial evaluation is let
+    through as soon as the recovery timeout has passed.
+    """
+
+    # pylint: disable=R0903
+    class State:
+        """
+        Defines constants for the states of the circuit.
+        """
+        CLOSED = 'closed'
+        OPEN = 'open'
+        HALF_OPEN = 'half_open'
+
+    DEFAULT_FAILURE_THRESHOLD = 5
+    DEFAULT_RECOVERY_TIMEOUT_SECONDS = 30.0
+
+    def __init__(self, failure_threshold: int = DEFAULT_FAILURE_THRESHOLD,
+                 recovery_timeout_seconds: float = DEFAULT_RECOVERY_TIMEOUT_SECONDS,
+                 probe: Optional[Callable[[], bool]] = None) -> None:
+        """
+        :param failure_threshold: number of consecutive failures which opens the circuit
+        :param recovery_timeout_seconds: delay after which the recovery is probed
+        :param probe: optional health check run in the background, returns `True` if the SDK is healthy
+        """
+        if failure_threshold <= 0:
+            raise ValueError(f"failure_threshold must be positive, got {failure_threshold}")
+        if recovery_timeout_seconds < 0:
+            raise ValueError(f"recovery_timeout_seconds must not be negative, got {recovery_timeout_seconds}")
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout_seconds = recovery_timeout_seconds
+        self.probe = probe
+        self.__state = CircuitBreaker.State.CLOSED
+        self.__failures = 0
+        self.__opened_at = 0.0
+        self.__probing = False
+        self.__trial_in_flight = False
+        self.__lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        """
+        Returns the current state of the circuit, one of `CircuitBreaker.State` constants.
+        """
+        return self.__state
+
+    def allow_request(self) -> bool:
+        """
+        Returns whether the evaluation can go through the SDK or must be short-circuited.
+        :return bool:
+        """
+        if self.__state == CircuitBreaker.State.CLOSED:
+            return True
+        with self.__lock:
+            if self.__state == CircuitBreaker.State.CLOSED:
+                return True
+            if self.__state == CircuitBreaker.State.OPEN:
+                if self.__probing or time.monotonic() - self.__opened_at < self.recovery_timeout_seconds:
+                    return False
+                if self.probe is not None:
+                    self.__probing = True
+                    threading.Thread(target=self.__run_probe, daemon=True).start()
+                    return False
+                self.__state = CircuitBreaker.State.HALF_OPEN
+            if self.__trial_in_flight:
+                return False
+            self.__trial_in_flight = True
+            return True
+
+    def record_success(self) -> None:
+        """
+        Records a successful evaluation, closing the circuit.
+        :return None:
+        """
+        if self.__state == CircuitBreaker.State.CLOSED and self.__failures == 0:
+            return
+        with self.__lock:
+            self.__state = CircuitBreaker.State.CLOSED
+            self.__failures = 0
+            self.__trial_in_flight = False
+
+    def release(self) -> None:
+        """
+        Records an evaluation whose outcome doesn't tell whether the SDK is healthy, e.g. rejected because of
+        an invalid context, letting another trial evaluation through if the circuit is half-open.
+        :return None:
+        """
+        if self.__state == CircuitBreaker.State.CLOSED:
+            return
+        with self.__lock:
+            self.__trial_in_flight = False
+
+    def record_failure(self) -> None:
+        """
+        Records a failed evaluation, opening the circuit if the threshold is reached or the trial failed.
+        :return None:
+        """
+        with self.__lock:
+            self.__failures += 1
+            if self.__state == CircuitBreaker.State.HALF_OPEN or self.__failures >= self.failure_threshold:
+                self.__open()
+
+    def reset(self) -> None:
+        """
+        Closes the circuit and forgets all failures.
+        :return None:
+        """
+        with self.__lock:
+            self.__state = CircuitBreaker.State.CLOSED
+            self.__failures = 0
+            self.__trial_in_flight = False
+
+    def __open(self) -> None:
+        """
+        Opens the circuit. Must be called with the lock held.
+        :return None:
+        """
+        self.__state = CircuitBreaker.State.OPEN
+        self.__opened_at = time.monotonic()
+        self.__trial_in_flight = False
+
+    def __run_probe(self) -> None:
+        """
+        Runs the probe and either lets a trial evaluation through or keeps the circuit open.
+        :return None:
+        """
+        try:
+            healthy = self.probe is not None and self.probe()
+        except Exception:  # pylint: disable=W0718
+            healthy = False
+        with self.__lock:
+            self.__probing = False
+            if self.__state != CircuitBreaker.State.OPEN:
+                return
+            if healthy:
+                self.__state = CircuitBreaker.State.HALF_OPEN
+            else:
+                self.__opened_at = time.monotonic()
@@ -0,0 +1,147 @@
+""" Kameleoon OpenFeature """
+import copy
+import hashlib
+import json
+from dataclasses import FrozenInstanceError
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Optional, Tuple, Union
+
+from kameleoon.data import Conversion, CustomData
+from kameleoon.exceptions import VisitorCodeInvalid
+from kameleoon.helpers.visitor_code import validate_visitor_code
+from openfeature.evaluation_context import EvaluationContext
+
+from kameleoon_openfeature.data_converter import DataConverter
+
+
+class CompiledContext(EvaluationContext):
+    """
+    CompiledContext is a frozen, pre-normalized evaluation context.
+
+    It is built once (usually per request) and can be passed to any number of evaluations: the targeting
+    key is validated, the Kameleoon data is converted and the variable key is extracted at construction,
+    so the provider skips all per-call normalization.
+
+    The OpenFeature client merges contexts into a new `EvaluationContext` before calling the provider,
+    so the compiled context keeps a reference to itself under `ATTRIBUTE_KEY`. The provider uses it only
+    if the merged context has the same targeting key and no additional attributes; otherwise the merged
+    context is normalized as usual.
+    """
+    ATTRIBUTE_KEY = 'kameleoonCompiledContext'
+    VARIABLE_KEY = 'variableKey'
+
+    _visitor_code: str
+    _variable_key: Optional[Any]
+    _kameleoon_data: Tuple[Union[CustomData, Conversion], ...]
+    _fingerprint: str
+
+    # pylint: disable=W0231
+    def __init__(self, targeting_key: Optional[str], attributes: Optional[Mapping[str, Any]] = None) -> None:
+        """
+        :param targeting_key: visitor code, must be a non-empty string up to 255 characters
+        :param attributes: attributes of the context, copied at construction
+        :raises VisitorCodeInvalid: if the targeting key is not a valid visitor code
+        """
+        if not isinstance(targeting_key, str):
+            raise VisitorCodeInvalid("visitor code must be a string")
+        validate_visitor_code(targeting_key)
+        source = {key: copy.deepcopy(value) for key, value in (attributes or {}).items()
+                  if key != self.ATTRIBUTE_KEY}
+        fingerprint = self.__make_fingerprint(targeting_key, source)
+        variable_key = source.get(self.VARIABLE_KEY)
+        kameleoon_data = tuple(DataConverter.to_kameleoon(EvaluationContext(targeting_key, source)))
+        object.__setattr__(self, 'targeting_key', targeting_key)
+        object.__setattr__(self, 'attributes', MappingProxyType({**source, self.ATTRIBUTE_KEY: self}))
+        object.__setattr__(self, '_visitor_code', targeting_key)
+        object.__setattr__(self, '_fingerprint', fingerprint)
+        object.__setattr__(self, '_variable_key', variable_key if variable_key != '' else None)
+        object.__setattr__(self, '_kameleoon_data', kameleoon_data)
+
+    @classmethod
+    def compile(cls, context: EvaluationContext) -> 'CompiledContext':
+        """
+        Builds a compiled context from the given evaluation context.
+        :param context:
+        :return CompiledContext:
+        """
+        if isinstance(context, CompiledContext):
+            return context
+        return cls(context.targeting_key, context.attributes)
+
+    @classmethod
+    def find(cls, context: Optional[EvaluationContext]) -> Optional['CompiledContext']:
+        """
+        Returns the compiled context carried by the given evaluation context if it can be used as is, i.e. if
+        the targeting key and all attributes are the ones of the compiled context.
+        :param context:
+        :return Optional[CompiledContext]:
+        """
+        if context is None:
+            return None
+        if isinstance(context, CompiledContext):
+            return context
+        attributes = context.attributes
+        compiled: Any = attributes.get(cls.ATTRIBUTE_KEY)
+        if (not isinstance(compiled, CompiledContext) or compiled.targeting_key != context.targeting_key
+                or len(compiled.attributes) != len(attributes)):
+            return None
+        # Merging copies the attribute references, so any overridden attribute is a different object.
+        if not all(attributes.get(key) is value for key, value in compiled.attributes.items()):
+            return None
+        return compiled
+
+    @property
+    def visitor_code(self) -> str:
+        """
+        Returns the validated targeting key.
+        """
+        return self._visitor_code
+
+    @property
+    def variable_key(self) -> Optional[Any]:
+        """
+        Returns the requested variable key, or `None` if it is not provided.
+        """
+        return self._variable_key
+
+    @property
+    def kameleoon_data(self) -> Tuple[Union[CustomData, Conversion], ...]:
+        """
+        Returns the Kameleoon data converted from the attributes.
+        """
+        return self._kameleoon_data
+
+    @property
+    def fingerprint(self) -> str:
+        """
+        Returns the stable hash of the targeting key and attributes, identical across processes.
+        """
+        return self._fingerprint
+
+    @staticmethod
+    def __make_fingerprint(targeting_key: str, attributes: Dict[str, Any]) -> str:
+        """
+        Computes a stable hash of the targeting key and attributes.
+        :param targeting_key:
+        :param attributes:
+        :return str:
+        """
+        payload = json.dumps([targeting_key, attributes], sort_keys=True, default=str, separators=(',', ':'))
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise FrozenInstanceError(f"cannot assign to field '{name}'")
+
+    def __delattr__(self, name: str) -> None:
+        raise FrozenInstanceError(f"cannot delete field '{name}'")
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, CompiledContext):
+            return NotImplemented
+        return self.fingerprint == other.fingerprint
+
+    def __hash__(self) -> int:
+        return int(self.fingerprint[:16], 16)
+
+    def __repr__(self) -> str:
+        return f"CompiledContext{{targeting_key:'{self.targeting_key}',fingerprint:'{self.fingerprint}'}}"
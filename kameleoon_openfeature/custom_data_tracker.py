@@ -0,0 +1,135 @@
+""" Kameleoon OpenFeature """
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, List, Optional, Sequence, Tuple
+
+from kameleoon.data import CustomData
+
+from kameleoon_openfeature.types import Data
+
+
+class CustomDataTracker:
+    """
+    CustomDataTracker remembers the custom data values last submitted to the Kameleoon SDK for each visitor.
+
+    The provider then only submits the custom data entries whose values changed since the previous evaluation
+    of the same visitor, instead of converting and adding every entry of the context again. Other Kameleoon
+    data, such as conversions, is always submitted. The state of a visitor expires after `ttl_seconds` without
+    evaluations, which should not exceed the session duration of the SDK: once the SDK has forgotten a visitor,
+    all of its custom data must be submitted again. The number of remembered visitors is bounded, the least
+    recently evaluated visitors are evicted first.
+    """
+    DEFAULT_TTL_SECONDS = 30 * 60.0
+    DEFAULT_MAX_VISITORS = 100_000
+
+    def __init__(self, ttl_seconds: Optional[float] = None, max_visitors: int = DEFAULT_MAX_VISITORS) -> None:
+        """
+        :param ttl_seconds: duration after which the state of an inactive visitor expires, if not provided,
+            the provider uses the session duration of the SDK
+        :param max_visitors: maximum number of visitors remembered at the same time
+        """
+        if ttl_seconds is not None and ttl_seconds <= 0:
+            raise ValueError(f"ttl_seconds must be positive, got {ttl_seconds}")
+        if max_visitors <= 0:
+            raise ValueError(f"max_visitors must be positive, got {max_visitors}")
+        self.ttl_seconds = ttl_seconds
+        self.max_visitors = max_visitors
+        self.__visitors: 'OrderedDict[str, Tuple[float, Dict[Hashable, Tuple[Any, ...]]]]' = OrderedDict()
+        self.__lock = threading.Lock()
+
+    def select_changed(self, visitor_code: str, entries: Sequence[Any]) -> List[Any]:
+        """
+        Returns the entries to submit for the visitor.
+
+        Entries are either `customData` attribute values (dictionaries with an index and values) or Kameleoon
+        data objects. Custom data whose values are unchanged since the last submission is left out, anything
+        else is kept. The entries are not remembered as submitted until `mark_submitted` is called, so that
+        concurrent evaluations of the visitor keep submitting them until they have been added to the SDK.
+        :param visitor_code:
+        :param entries:
+        :return List[Any]:
+        """
+        ttl_seconds = self.ttl_seconds if self.ttl_seconds is not None else self.DEFAULT_TTL_SECONDS
+        now = time.monotonic()
+        with self.__lock:
+            state = self.__visitors.get(visitor_code)
+            if state is None or state[0] + ttl_seconds <= now:
+                submitted: Dict[Hashable, Tuple[Any, ...]] = {}
+            else:
+                submitted = state[1]
+            self.__visitors[visitor_code] = (now, submitted)
+            self.__visitors.move_to_end(visitor_code)
+            if len(self.__visitors) > self.max_visitors:
+                self.__visitors.popitem(last=False)
+            changed = []
+            for entry in entries:
+                key = self.__get_key(entry)
+                if key is None or submitted.get(key[0]) != key[1]:
+                    changed.append(entry)
+            return changed
+
+    def mark_submitted(self, visitor_code: str, entries: Sequence[Any]) -> None:
+        """
+        Remembers the values of the custom data entries as submitted for the visitor, once they have been added
+        to the SDK. Nothing is remembered if the state of the visitor has been evicted or forgotten meanwhile.
+        :param visitor_code:
+        :param entries:
+        :return None:
+        """
+        with self.__lock:
+            state = self.__visitors.get(visitor_code)
+            if state is None:
+                return
+            submitted = state[1]
+            for entry in entries:
+                key = self.__get_key(entry)
+                if key is not None:
+                    submitted[key[0]] = key[1]
+
+    def forget(self, visitor_code: str) -> None:
+        """
+        Forgets the submitted values of the visitor, so that all of its custom data is submitted next time.
+        :param visitor_code:
+        :return None:
+        """
+        with self.__lock:
+            self.__visitors.pop(visitor_code, None)
+
+    def clear(self) -> None:
+        """
+        Forgets the submitted values of all visitors.
+        :return None:
+        """
+        with self.__lock:
+            self.__visitors.clear()
+
+    @staticmethod
+    def __get_key(entry: Any) -> Optional[Tuple[Hashable, Tuple[Any, ...]]]:
+        """
+        Returns the index and the values of a custom data entry.
+        :param entry:
+        :return Optional[Tuple[Hashable, Tuple[Any, ...]]]: `None` if the entry is not trackable custom data.
+        """
+        if isinstance(entry, CustomData):
+            index = entry.name if entry.index == CustomData.UNDEFINED_INDEX else entry.index
+            values: Any = entry.values
+        elif isinstance(entry, dict):
+            index = entry.get(Data.CustomDataType.INDEX)
+            values = entry.get(Data.CustomDataType.VALUES, [])
+            if isinstance(values, str):
+                values = (values,)
+            elif values is None:
+                values = ()
+        else:
+            return None
+        try:
+            key = (index, tuple(values))
+            hash(key)
+        except TypeError:
+            return None
+        return key
+
+    def __len__(self) -> int:
+        with self.__lock:
+            return len(self.__visitors)
@@ -20,12 +20,15 @@ class DataConverter:
     }
 
     @classmethod
-    def to_kameleoon(cls, context: Optional[EvaluationContext]) -> List[Union[CustomData, Conversion]]:
+    def to_kameleoon(cls, context: Optional[EvaluationContext],
+                     custom_data_filter: Optional[Callable[[List[Any]], List[Any]]] = None
+                     ) -> List[Union[CustomData, Conversion]]:
         """
         Converts the given context to a list of Kameleoon data objects.
 
         Args:
             context (object): The context containing attributes to be converted.
+            custom_data_filter (callable): Optional function selecting the custom data values to convert.
 
         Returns:
             list: A list of Kameleoon data objects.
@@ -39,6 +42,8 @@ class DataConverter:
             if method is None or value is None:
                 continue
             values = value if isinstance(value, list) else [value]
+            if custom_data_filter is not None and key == Data.Type.CUSTOM_DATA:
+                values = custom_data_filter(values)
             for val in values:
                 data.append(method(val))
 
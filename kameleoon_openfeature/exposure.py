@@ -0,0 +1,88 @@
+""" Kameleoon OpenFeature """
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+
+
+class ExposureDeduplicator:
+    """
+    ExposureDeduplicator remembers which visitor/flag/variant exposures have already been tracked.
+
+    Each exposure is tracked once per time window; repeated evaluations of the same flag for the same
+    visitor within the window are evaluated without tracking. The window should not exceed the session
+    duration of the SDK, so that the exposures of each new visit are tracked. The number of remembered
+    visitors is bounded, the least recently evaluated visitors are evicted first.
+    """
+    DEFAULT_WINDOW_SECONDS = 30 * 60.0
+    DEFAULT_MAX_VISITORS = 100_000
+
+    def __init__(self, window_seconds: Optional[float] = None,
+                 max_visitors: int = DEFAULT_MAX_VISITORS) -> None:
+        """
+        :param window_seconds: duration during which an exposure is tracked only once, if not provided,
+            the provider uses the session duration of the SDK
+        :param max_visitors: maximum number of visitors remembered at the same time
+        """
+        if window_seconds is not None and window_seconds <= 0:
+            raise ValueError(f"window_seconds must be positive, got {window_seconds}")
+        if max_visitors <= 0:
+            raise ValueError(f"max_visitors must be positive, got {max_visitors}")
+        self.window_seconds = window_seconds
+        self.max_visitors = max_visitors
+        self.__exposures: 'OrderedDict[str, Dict[str, Tuple[str, float]]]' = OrderedDict()
+        self.__lock = threading.Lock()
+
+    def get_tracked_variant(self, visitor_code: str, flag_key: str) -> Optional[str]:
+        """
+        Returns the variant whose exposure was tracked for the visitor and flag within the current window.
+        :param visitor_code:
+        :param flag_key:
+        :return Optional[str]: `None` if the exposure has to be tracked.
+        """
+        now = time.monotonic()
+        with self.__lock:
+            flags = self.__exposures.get(visitor_code)
+            if flags is None:
+                return None
+            self.__exposures.move_to_end(visitor_code)
+            exposure = flags.get(flag_key)
+            if exposure is None:
+                return None
+            variant, expires_at = exposure
+            if expires_at <= now:
+                del flags[flag_key]
+                return None
+            return variant
+
+    def mark_tracked(self, visitor_code: str, flag_key: str, variant: str) -> None:
+        """
+        Remembers that the exposure of the visitor to the flag variant has been tracked.
+        :param visitor_code:
+        :param flag_key:
+        :param variant:
+        :return None:
+        """
+        window_seconds = self.window_seconds if self.window_seconds is not None else self.DEFAULT_WINDOW_SECONDS
+        expires_at = time.monotonic() + window_seconds
+        with self.__lock:
+            flags = self.__exposures.get(visitor_code)
+            if flags is None:
+                flags = self.__exposures[visitor_code] = {}
+                if len(self.__exposures) > self.max_visitors:
+                    self.__exposures.popitem(last=False)
+            else:
+                self.__exposures.move_to_end(visitor_code)
+            flags[flag_key] = (variant, expires_at)
+
+    def clear(self) -> None:
+        """
+        Forgets all tracked exposures.
+        :return None:
+        """
+        with self.__lock:
+            self.__exposures.clear()
+
+    def __len__(self) -> int:
+        with self.__lock:
+            return len(self.__exposures)
@@ -1,4 +1,5 @@
 """ Kameleoon OpenFeature """
+import threading
 import typing
 
 from kameleoon import KameleoonClientFactory, KameleoonClientConfig, KameleoonClient
@@ -7,9 +8,17 @@ from openfeature.evaluation_context import EvaluationContext
 from openfeature.exception import ProviderNotReadyError
 from openfeature.flag_evaluation import FlagResolutionDetails
 from openfeature.hook import Hook
+from openfeature.event import ProviderEventDetails
 from openfeature.provider import AbstractProvider, Metadata
 
+from kameleoon_openfeature.circuit_breaker import CircuitBreaker
+from kameleoon_openfeature.custom_data_tracker import CustomDataTracker
+from kameleoon_openfeature.exposure import ExposureDeduplicator
+from kameleoon_openfeature.last_known_good import LastKnownGoodStore
+from kameleoon_openfeature.resolution_cache import ResolutionDetailsCache
 from kameleoon_openfeature.resolver import KameleoonResolver
+from kameleoon_openfeature.tracing import EvaluationTracer
+from kameleoon_openfeature.warm_up import WarmUpReport
 
 
 class KameleoonProvider(AbstractProvider):
@@ -17,12 +26,50 @@ class KameleoonProvider(AbstractProvider):
     The KameleoonProvider class is an implementation of the AbstractProvider interface for the Kameleoon SDK.
     """
     META_NAME = "Kameleoon Provider"
+    INITIALIZATION_RETRY_INTERVAL_SECONDS = 5.0
 
-    def __init__(self, site_code, config: typing.Optional[KameleoonClientConfig] = None, ):
+    # pylint: disable=R0913
+    def __init__(self, site_code, config: typing.Optional[KameleoonClientConfig] = None,
+                 tracer: typing.Optional[EvaluationTracer] = None,
+                 exposure_deduplicator: typing.Optional[ExposureDeduplicator] = None,
+                 circuit_breaker: typing.Optional[CircuitBreaker] = None,
+                 last_known_good: typing.Optional[LastKnownGoodStore] = None,
+                 resolution_cache: typing.Optional[ResolutionDetailsCache] = None,
+                 custom_data_tracker: typing.Optional[CustomDataTracker] = None,
+                 warm_up: bool = False):
+        """
+        :param site_code: code of the Kameleoon site
+        :param config: configuration of the KameleoonClient SDK instance
+        :param tracer: optional tracer sampling evaluations and capturing slow ones
+        :param exposure_deduplicator: optional deduplicator tracking each exposure once per time window,
+            if it has no window, the session duration of the SDK is used
+        :param circuit_breaker: optional circuit breaker short-circuiting evaluations while the SDK is degraded,
+            if it has no probe, the provider probes whether the SDK has loaded its configuration
+        :param last_known_good: optional store of last known good results served while the SDK can't evaluate
+            flags, if it is not empty, `initialize` doesn't wait for the SDK
+        :param resolution_cache: optional cache of the immutable results reused for identical evaluations,
+            a default cache is used if not provided
+        :param custom_data_tracker: optional tracker submitting only the custom data which changed since the
+            previous evaluation of the visitor, if it has no TTL, the session duration of the SDK is used
+        :param warm_up: whether `initialize` caches the results of all configured flag variations once the SDK
+            is ready, see `get_warm_up_report`
+        """
         super().__init__()
         self.__site_code = site_code
         self.__client = self.__make_kameleoon_client(site_code, config)
-        self.__resolver = KameleoonResolver(self.__client)
+        if circuit_breaker is not None and circuit_breaker.probe is None:
+            circuit_breaker.probe = self.__is_client_healthy
+        if exposure_deduplicator is not None and exposure_deduplicator.window_seconds is None and config is not None:
+            exposure_deduplicator.window_seconds = config.session_duration_second
+        if custom_data_tracker is not None and custom_data_tracker.ttl_seconds is None and config is not None:
+            custom_data_tracker.ttl_seconds = config.session_duration_second
+        self.__last_known_good = last_known_good
+        self.__custom_data_tracker = custom_data_tracker
+        self.__warm_up = warm_up
+        self.__warm_up_report: typing.Optional[WarmUpReport] = None
+        self.__shut_down = threading.Event()
+        self.__resolver = KameleoonResolver(self.__client, tracer, exposure_deduplicator, circuit_breaker,
+                                            last_known_good, resolution_cache, custom_data_tracker)
 
     @staticmethod
     def __make_kameleoon_client(site_code: str, config: typing.Optional[KameleoonClientConfig] = None
@@ -38,6 +85,14 @@ class KameleoonProvider(AbstractProvider):
         except KameleoonError as ex:
             raise ProviderNotReadyError(ex.message) from ex
 
+    def __is_client_healthy(self) -> bool:
+        """
+        Checks whether the KameleoonClient SDK instance is available and has loaded its configuration.
+        :return bool:
+        """
+        client = self.__client
+        return client is not None and len(client.get_feature_list()) > 0
+
     def get_metadata(self) -> Metadata:
         """
         Returns the metadata of the provider.
@@ -122,21 +177,101 @@ class KameleoonProvider(AbstractProvider):
     def initialize(self, evaluation_context: EvaluationContext) -> None:
         """
         Initializes the KameleoonClient SDK instance.
+
+        If the last known good store is not empty, the SDK is initialized in the background and the stored
+        results are served until it is ready. If the warm-up is enabled, it runs once the SDK is ready.
         :param evaluation_context:
         :return None:
         """
+        if self.__last_known_good is not None and len(self.__last_known_good) > 0:
+            self.__resolver.ready = False
+            threading.Thread(target=self.__initialize_in_background, daemon=True).start()
+            return
         try:
-            self.__client.wait_init()
+            initialized = self.__client.wait_init()
         except (TimeoutError, Exception) as exception:
             raise ProviderNotReadyError(str(exception)) from exception
+        if initialized:
+            self.__run_warm_up()
+
+    def __initialize_in_background(self) -> None:
+        """
+        Waits for the KameleoonClient SDK instance to be initialized, then switches to live evaluations.
+        While the initialization fails, the last known good results keep being served and the SDK, which keeps
+        retrying in the background, is waited for again every `INITIALIZATION_RETRY_INTERVAL_SECONDS` until
+        it is ready or the provider is shut down. The first failure is emitted as a provider error, the
+        recovery as the provider being ready.
+        :return None:
+        """
+        client = self.__client
+        failed = False
+        while True:
+            try:
+                initialized = client.wait_init()
+                message = 'The Kameleoon SDK failed to initialize.'
+            except (TimeoutError, Exception) as exception:  # pylint: disable=W0718
+                initialized = False
+                message = str(exception)
+            if initialized:
+                break
+            if not failed:
+                failed = True
+                self.emit_provider_error(ProviderEventDetails(message=message))
+            if self.__shut_down.wait(self.INITIALIZATION_RETRY_INTERVAL_SECONDS):
+                return
+        self.__run_warm_up()
+        self.__resolver.ready = True
+        if failed:
+            self.emit_provider_ready(ProviderEventDetails())
+
+    def __run_warm_up(self) -> None:
+        """
+        Warms up the evaluations if enabled. A failed warm-up doesn't fail the initialization, its error is
+        recorded in the report.
+        :return None:
+        """
+        if not self.__warm_up:
+            return
+        try:
+            report = self.__resolver.warm_up()
+        except Exception as exception:  # pylint: disable=W0718
+            report = WarmUpReport()
+            report.error = str(exception)
+            report.finish()
+        self.__warm_up_report = report
+
+    def get_warm_up_report(self) -> typing.Optional[WarmUpReport]:
+        """
+        Returns the report of the warm-up run by `initialize`.
+        :return Optional[WarmUpReport]: `None` if the warm-up is disabled or hasn't run yet.
+        """
+        return self.__warm_up_report
 
     def shutdown(self) -> None:
         """
         Forgets the KameleoonClient SDK instance.
         :return None:
         """
-        KameleoonClientFactory.forget(self.__site_code)
+        self.__shut_down.set()
+        self.__forget_client()
         self.__client = None
+        self.__resolver.client = None
+        if self.__custom_data_tracker is not None:
+            self.__custom_data_tracker.clear()
+
+    def __forget_client(self) -> None:
+        """
+        Removes the KameleoonClient SDK instance from the factory, unless the factory already holds another
+        instance for the site code, e.g. the one of a new provider swapped in before this one is shut down.
+        :return None:
+        """
+        client = self.__client
+        if client is None:
+            return
+        # The factory has no public lookup which doesn't create a client.
+        with KameleoonClientFactory._lock:  # pylint: disable=W0212
+            if KameleoonClientFactory._clients.get(self.__site_code) is client:  # pylint: disable=W0212
+                KameleoonClientFactory.forget(self.__site_code)
 
     def get_client(self) -> KameleoonClient:
         """
@@ -0,0 +1,74 @@
+""" Kameleoon OpenFeature """
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+
+class LastKnownGoodStore:
+    """
+    LastKnownGoodStore keeps the last successfully evaluated variant of each flag per visitor, and the
+    variables of each flag variant.
+
+    The provider serves these results with `Reason.STALE` while the Kameleoon SDK can't evaluate flags: while
+    a new client initializes, after the provider is shut down, or while the SDK is failing. The same store can
+    be shared by an old and a new provider of the same site to swap them without serving default values.
+    The number of remembered visitor/flag pairs is bounded, the least recently evaluated are evicted first.
+    """
+    DEFAULT_MAX_ENTRIES = 100_000
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES) -> None:
+        """
+        :param max_entries: maximum number of visitor/flag pairs remembered at the same time
+        """
+        if max_entries <= 0:
+            raise ValueError(f"max_entries must be positive, got {max_entries}")
+        self.max_entries = max_entries
+        self.__variants: 'OrderedDict[Tuple[str, str], str]' = OrderedDict()
+        self.__variables: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        self.__lock = threading.Lock()
+
+    def save(self, visitor_code: str, flag_key: str, variant: str, variables: Dict[str, Any]) -> None:
+        """
+        Remembers the result of a successful evaluation.
+        :param visitor_code:
+        :param flag_key:
+        :param variant:
+        :param variables:
+        :return None:
+        """
+        key = (visitor_code, flag_key)
+        with self.__lock:
+            self.__variables[(flag_key, variant)] = variables
+            self.__variants[key] = variant
+            self.__variants.move_to_end(key)
+            if len(self.__variants) > self.max_entries:
+                self.__variants.popitem(last=False)
+
+    def get(self, visitor_code: str, flag_key: str) -> Optional[Tuple[str, Dict[str, Any]]]:
+        """
+        Returns the last known good variant of the flag for the visitor and its variables.
+        :param visitor_code:
+        :param flag_key:
+        :return Optional[Tuple[str, Dict[str, Any]]]: `None` if the flag was never evaluated for the visitor.
+        """
+        with self.__lock:
+            variant = self.__variants.get((visitor_code, flag_key))
+            if variant is None:
+                return None
+            variables = self.__variables.get((flag_key, variant))
+            if variables is None:
+                return None
+            return variant, variables
+
+    def clear(self) -> None:
+        """
+        Forgets all results.
+        :return None:
+        """
+        with self.__lock:
+            self.__variants.clear()
+            self.__variables.clear()
+
+    def __len__(self) -> int:
+        with self.__lock:
+            return len(self.__variants)
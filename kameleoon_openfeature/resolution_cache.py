@@ -0,0 +1,162 @@
+""" Kameleoon OpenFeature """
+import threading
+from collections import OrderedDict
+from dataclasses import FrozenInstanceError, fields
+from types import MappingProxyType
+from typing import Any, Optional, Tuple
+
+from openfeature.exception import ErrorCode
+from openfeature.flag_evaluation import FlagResolutionDetails, Reason
+
+
+class FrozenResolutionDetails(FlagResolutionDetails[Any]):
+    """
+    FrozenResolutionDetails is an immutable FlagResolutionDetails which can be shared between evaluations.
+
+    It is equal to any FlagResolutionDetails with the same field values.
+    """
+    _EMPTY_METADATA: MappingProxyType = MappingProxyType({})  # type: ignore[type-arg]
+    _FIELD_NAMES = tuple(field.name for field in fields(FlagResolutionDetails))
+
+    # pylint: disable=W0231,R0913
+    def __init__(self, value: Any, error_code: Optional[ErrorCode] = None, error_message: Optional[str] = None,
+                 reason: Optional[str] = None, variant: Optional[str] = None) -> None:
+        object.__setattr__(self, 'value', value)
+        object.__setattr__(self, 'error_code', error_code)
+        object.__setattr__(self, 'error_message', error_message)
+        object.__setattr__(self, 'reason', reason)
+        object.__setattr__(self, 'variant', variant)
+        object.__setattr__(self, 'flag_metadata', self._EMPTY_METADATA)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise FrozenInstanceError(f"cannot assign to field '{name}'")
+
+    def __delattr__(self, name: str) -> None:
+        raise FrozenInstanceError(f"cannot delete field '{name}'")
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, FlagResolutionDetails):
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in self._FIELD_NAMES)
+
+    def __hash__(self) -> int:
+        return hash((self.value, self.error_code, self.error_message, self.reason, self.variant))
+
+
+class ResolutionDetailsCache:
+    """
+    ResolutionDetailsCache reuses immutable FlagResolutionDetails instances for identical evaluation results.
+
+    Successful results are keyed by flag, variant, variable key, value type and reason, and are reused as long as
+    the value is unchanged. Error results are keyed by error code, message, variant and default value; errors with
+    a message longer than `MAX_ERROR_MESSAGE_LENGTH` are not cached. Only results with scalar values are cached.
+    Successful and error results are bounded separately, so that errors never evict successful results, and the
+    least recently used results are evicted first.
+    """
+    CACHEABLE_TYPES = (bool, int, float, str)
+    DEFAULT_MAX_ENTRIES = 10_000
+    DEFAULT_MAX_ERROR_ENTRIES = 1_000
+    MAX_ERROR_MESSAGE_LENGTH = 256
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES,
+                 max_error_entries: int = DEFAULT_MAX_ERROR_ENTRIES) -> None:
+        """
+        :param max_entries: maximum number of cached successful results, `0` disables their caching
+        :param max_error_entries: maximum number of cached error results, `0` disables their caching
+        """
+        if max_entries < 0:
+            raise ValueError(f"max_entries must not be negative, got {max_entries}")
+        if max_error_entries < 0:
+            raise ValueError(f"max_error_entries must not be negative, got {max_error_entries}")
+        self.max_entries = max_entries
+        self.max_error_entries = max_error_entries
+        self.__successes: 'OrderedDict[Tuple[Any, ...], FlagResolutionDetails[Any]]' = OrderedDict()
+        self.__errors: 'OrderedDict[Tuple[Any, ...], FlagResolutionDetails[Any]]' = OrderedDict()
+        self.__lock = threading.Lock()
+
+    # pylint: disable=R0913
+    def get_success(self, flag_key: str, variant: str, variable_key: Any, value: Any,
+                    reason: str = Reason.STATIC) -> FlagResolutionDetails[Any]:
+        """
+        Returns the result of a successful evaluation.
+        :param flag_key:
+        :param variant:
+        :param variable_key:
+        :param value:
+        :param reason:
+        :return FlagResolutionDetails:
+        """
+        if self.max_entries == 0 or type(value) not in self.CACHEABLE_TYPES:
+            return FlagResolutionDetails(value=value, reason=reason, variant=variant)
+        key = (flag_key, variant, variable_key, type(value), reason)
+        with self.__lock:
+            result = self.__successes.get(key)
+            if result is not None and result.value == value:
+                self.__successes.move_to_end(key)
+                return result
+            result = FrozenResolutionDetails(value=value, reason=reason, variant=variant)
+            self.__store(self.__successes, key, result, self.max_entries)
+            return result
+
+    def get_error(self, default_value: Any, error_code: ErrorCode, error_message: Optional[str],
+                  variant: Optional[str] = None) -> FlagResolutionDetails[Any]:
+        """
+        Returns the result of a failed evaluation, with the default value and `Reason.ERROR`.
+        :param default_value:
+        :param error_code:
+        :param error_message:
+        :param variant:
+        :return FlagResolutionDetails:
+        """
+        if (self.max_error_entries == 0 or type(default_value) not in self.CACHEABLE_TYPES
+                or (error_message is not None and len(error_message) > self.MAX_ERROR_MESSAGE_LENGTH)):
+            return FlagResolutionDetails(value=default_value, error_code=error_code, error_message=error_message,
+                                         reason=Reason.ERROR, variant=variant)
+        key = (error_code, error_message, variant, type(default_value), default_value)
+        with self.__lock:
+            result = self.__errors.get(key)
+            if result is not None:
+                self.__errors.move_to_end(key)
+                return result
+            result = FrozenResolutionDetails(value=default_value, error_code=error_code,
+                                             error_message=error_message, reason=Reason.ERROR, variant=variant)
+            self.__store(self.__errors, key, result, self.max_error_entries)
+            return result
+
+    def get_success_count(self) -> int:
+        """
+        Returns the number of cached successful results.
+        :return int:
+        """
+        with self.__lock:
+            return len(self.__successes)
+
+    def clear(self) -> None:
+        """
+        Removes all cached results.
+        :return None:
+        """
+        with self.__lock:
+            self.__successes.clear()
+            self.__errors.clear()
+
+    @staticmethod
+    def __store(results: 'OrderedDict[Tuple[Any, ...], FlagResolutionDetails[Any]]', key: Tuple[Any, ...],
+                result: FlagResolutionDetails[Any], max_entries: int) -> None:
+        """
+        Caches the result, evicting the least recently used result if the cache is full.
+        Must be called with the lock held.
+        :param results:
+        :param key:
+        :param result:
+        :param max_entries:
+        :return None:
+        """
+        results[key] = result
+        results.move_to_end(key)
+        if len(results) > max_entries:
+            results.popitem(last=False)
+
+    def __len__(self) -> int:
+        with self.__lock:
+            return len(self.__successes) + len(self.__errors)
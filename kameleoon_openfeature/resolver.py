@@ -1,13 +1,22 @@
 """ Kameleoon OpenFeature """
-from typing import Optional, Any
+from typing import Optional, Any, Dict, Sequence, Tuple, Union
 
 from kameleoon import KameleoonClient
+from kameleoon.data import Conversion, CustomData
 from kameleoon.exceptions import VisitorCodeInvalid, FeatureVariationNotFound, FeatureError, FeatureNotFound
 from openfeature.evaluation_context import EvaluationContext
 from openfeature.exception import ErrorCode
 from openfeature.flag_evaluation import FlagResolutionDetails, Reason
 
+from kameleoon_openfeature.circuit_breaker import CircuitBreaker
+from kameleoon_openfeature.context import CompiledContext
+from kameleoon_openfeature.custom_data_tracker import CustomDataTracker
 from kameleoon_openfeature.data_converter import DataConverter
+from kameleoon_openfeature.exposure import ExposureDeduplicator
+from kameleoon_openfeature.last_known_good import LastKnownGoodStore
+from kameleoon_openfeature.resolution_cache import ResolutionDetailsCache
+from kameleoon_openfeature.tracing import EvaluationTrace, EvaluationTracer
+from kameleoon_openfeature.warm_up import WarmUpReport
 
 
 class Resolver:
@@ -30,75 +39,305 @@ class KameleoonResolver(Resolver):
     """
     Implementation of the Resolver class for Kameleoon.
     """
-    VARIABLE_KEY = 'variableKey'
+    VARIABLE_KEY = CompiledContext.VARIABLE_KEY
+    CIRCUIT_OPEN_MESSAGE = 'The Kameleoon SDK is degraded, the evaluation is short-circuited to the default value.'
+    NOT_READY_MESSAGE = 'The Kameleoon SDK is not ready.'
+    NOT_LOADED_MESSAGE = 'The Kameleoon SDK has not loaded its configuration.'
+    WARM_UP_CACHE_RATIO = 0.9
+    WARM_UP_VISITOR_CODE = 'kameleoon-openfeature-warm-up'
 
-    def __init__(self, client: KameleoonClient):
+    # pylint: disable=R0913
+    def __init__(self, client: KameleoonClient, tracer: Optional[EvaluationTracer] = None,
+                 deduplicator: Optional[ExposureDeduplicator] = None,
+                 circuit_breaker: Optional[CircuitBreaker] = None,
+                 last_known_good: Optional[LastKnownGoodStore] = None,
+                 resolution_cache: Optional[ResolutionDetailsCache] = None,
+                 custom_data_tracker: Optional[CustomDataTracker] = None):
         self.client = client
+        self.tracer = tracer
+        self.deduplicator = deduplicator
+        self.circuit_breaker = circuit_breaker
+        self.last_known_good = last_known_good
+        self.resolution_cache = resolution_cache if resolution_cache is not None else ResolutionDetailsCache()
+        self.custom_data_tracker = custom_data_tracker
+        self.ready = True
 
-    # pylint: disable=R0911
     def resolve(self, flag_key: str, default_value: Any, evaluation_context: Optional[EvaluationContext] = None
                 ) -> FlagResolutionDetails[Any]:
+        if self.client is None or not self.ready:
+            return (self.__resolve_stale(flag_key, default_value, evaluation_context)
+                    or self._create_error_response(default_value, ErrorCode.PROVIDER_NOT_READY,
+                                                   self.NOT_READY_MESSAGE))
+        tracer = self.tracer
+        trace = tracer.begin(flag_key, evaluation_context) if tracer is not None else None
+        result = self.__resolve(flag_key, default_value, evaluation_context, trace)
+        if tracer is not None and trace is not None:
+            tracer.end(trace, result)
+        if result.error_code == ErrorCode.GENERAL:
+            return self.__resolve_stale(flag_key, default_value, evaluation_context) or result
+        return result
+
+    def warm_up(self) -> WarmUpReport:
+        """
+        Assigns a variation of every configured flag to a synthetic visitor without tracking it, so that the
+        evaluation path of the SDK is run once per flag, then fetches the variables of every variation and caches
+        the resolution details of their scalar values. The warm-up fills at most `WARM_UP_CACHE_RATIO` of the
+        resolution cache, leaving room for the results of the first evaluations.
+        :return WarmUpReport:
+        """
+        report = WarmUpReport()
+        cache = self.resolution_cache
+        budget = int(cache.max_entries * self.WARM_UP_CACHE_RATIO)
+        for flag_key, feature_flag in self.client.get_data_file().feature_flags.items():
+            report.flags += 1
+            try:
+                self.client.get_variation(self.WARM_UP_VISITOR_CODE, flag_key, track=False)
+                report.evaluated_flags += 1
+            except Exception:  # pylint: disable=W0718
+                report.failures += 1
+            for variant in feature_flag.variations:
+                report.variants += 1
+                try:
+                    variables = self.client.get_feature_variation_variables(flag_key, variant)
+                except Exception:  # pylint: disable=W0718
+                    report.failures += 1
+                    continue
+                for variable_key, value in variables.items():
+                    if cache.get_success_count() >= budget or type(value) not in cache.CACHEABLE_TYPES:
+                        continue
+                    cache.get_success(flag_key, variant, variable_key, value)
+                    report.cached_results += 1
+        report.finish()
+        return report
+
+    def __resolve(self, flag_key: str, default_value: Any, evaluation_context: Optional[EvaluationContext],
+                  trace: Optional[EvaluationTrace]) -> FlagResolutionDetails[Any]:
+        """
+        Resolves the value of the flag, recording stage timings into the trace if one is given.
+        Only evaluations which reach the SDK go through the circuit breaker and are recorded by it. Only the
+        targeting key is checked before the circuit breaker is asked, the Kameleoon data is converted once the
+        evaluation is let through, so that short-circuited evaluations don't depend on the size of the context.
+        :param flag_key:
+        :param default_value:
+        :param evaluation_context:
+        :param trace:
+        :return FlagResolutionDetails:
+        """
+        compiled = CompiledContext.find(evaluation_context)
+        visitor_code = compiled.visitor_code if compiled is not None else \
+            KameleoonResolver.__get_targeting_key(evaluation_context)
+        if evaluation_context is None or visitor_code is None or visitor_code == '':
+            return self._create_error_response(
+                default_value,
+                ErrorCode.TARGETING_KEY_MISSING,
+                'The TargetingKey is required in context and cannot be omitted.'
+            )
+        circuit_breaker = self.circuit_breaker
+        if circuit_breaker is not None and not circuit_breaker.allow_request():
+            return self._create_error_response(default_value, ErrorCode.GENERAL, self.CIRCUIT_OPEN_MESSAGE)
         try:
-            visitor_code = self.__get_targeting_key(evaluation_context) if evaluation_context is not None else None
-            if visitor_code is None or visitor_code == '':
-                return self._create_error_response(
-                    default_value,
-                    ErrorCode.TARGETING_KEY_MISSING,
-                    'The TargetingKey is required in context and cannot be omitted.'
-                )
+            normalized = self.__normalize_context(visitor_code, compiled, evaluation_context)
+        except Exception as exception:  # pylint: disable=W0718
+            if circuit_breaker is not None:
+                circuit_breaker.release()
+            error_code = ErrorCode.INVALID_CONTEXT if isinstance(exception, VisitorCodeInvalid) else ErrorCode.GENERAL
+            return self._create_error_response(default_value, error_code, str(exception))
+        if trace is not None:
+            trace.mark('to_kameleoon')
+        result = self.__evaluate(flag_key, default_value, normalized, trace)
+        if circuit_breaker is None:
+            return result
+        if result.error_code == ErrorCode.GENERAL:
+            circuit_breaker.record_failure()
+        elif result.error_code == ErrorCode.INVALID_CONTEXT:
+            circuit_breaker.release()
+        else:
+            circuit_breaker.record_success()
+        return result
 
-            self.client.add_data(visitor_code, *DataConverter.to_kameleoon(evaluation_context))
+    def __evaluate(self, flag_key: str, default_value: Any,
+                   normalized: Tuple[str, Sequence[Union[CustomData, Conversion]], Any],
+                   trace: Optional[EvaluationTrace]) -> FlagResolutionDetails[Any]:
+        """
+        Evaluates the flag with the SDK for the normalized context.
+        :param flag_key:
+        :param default_value:
+        :param normalized: visitor code, Kameleoon data and requested variable key
+        :param trace:
+        :return FlagResolutionDetails:
+        """
+        visitor_code, data, requested_variable_key = normalized
+        try:
+            self.__add_data(visitor_code, data)
+            if trace is not None:
+                trace.mark('add_data')
 
-            variant = self.client.get_feature_variation_key(visitor_code, flag_key)
+            variant = self.__get_variant(visitor_code, flag_key)
+            if trace is not None:
+                trace.mark('get_feature_variation_key')
             variables = self.client.get_feature_variation_variables(flag_key, variant)
+            if trace is not None:
+                trace.mark('get_feature_variation_variables')
+            if self.last_known_good is not None:
+                self.last_known_good.save(visitor_code, flag_key, variant, variables)
 
-            variable_key = self.__get_variable_key(evaluation_context, variables)
-            value = variables.get(variable_key)
-
-            if value is None or variable_key == '':
-                return self._create_error_response(default_value, ErrorCode.FLAG_NOT_FOUND,
-                                                   self.__make_error_description(variant, variable_key), variant)
-
-            if type(value) is type(default_value):
-                return FlagResolutionDetails(
-                    value=value,
-                    reason=Reason.STATIC,
-                    variant=variant
-                )
-            return self._create_error_response(default_value,
-                                               ErrorCode.TYPE_MISMATCH,
-                                               'The type of value received is different from the requested value.',
-                                               variant)
+            return self.__make_result(flag_key, default_value, variant, variables, requested_variable_key,
+                                      Reason.STATIC)
         except VisitorCodeInvalid as exception:
             return self._create_error_response(default_value, ErrorCode.INVALID_CONTEXT, str(exception))
         except (FeatureError, FeatureNotFound, FeatureVariationNotFound) as exception:
+            if not self.__is_configuration_loaded():
+                return self._create_error_response(default_value, ErrorCode.GENERAL, self.NOT_LOADED_MESSAGE)
             return self._create_error_response(default_value, ErrorCode.FLAG_NOT_FOUND, str(exception))
         except Exception as exception:  # pylint: disable=W0718
             return self._create_error_response(default_value, ErrorCode.GENERAL, str(exception))
 
+    def __is_configuration_loaded(self) -> bool:
+        """
+        Checks whether the SDK has loaded its configuration. Until it has, e.g. while its initialization is
+        stuck, every flag is reported as not found, which is a failure of the SDK rather than of the flag.
+        :return bool:
+        """
+        try:
+            return len(self.client.get_feature_list()) > 0
+        except Exception:  # pylint: disable=W0718
+            return False
+
+    def __resolve_stale(self, flag_key: str, default_value: Any, evaluation_context: Optional[EvaluationContext]
+                        ) -> Optional[FlagResolutionDetails[Any]]:
+        """
+        Resolves the value of the flag from the last known good result.
+        :param flag_key:
+        :param default_value:
+        :param evaluation_context:
+        :return Optional[FlagResolutionDetails]: `None` if there is no last known good result.
+        """
+        if self.last_known_good is None or evaluation_context is None:
+            return None
+        compiled = CompiledContext.find(evaluation_context)
+        visitor_code: Optional[str]
+        if compiled is not None:
+            visitor_code, requested_variable_key = compiled.visitor_code, compiled.variable_key
+        else:
+            visitor_code = self.__get_targeting_key(evaluation_context)
+            requested_variable_key = evaluation_context.attributes.get(KameleoonResolver.VARIABLE_KEY)
+        if visitor_code is None or visitor_code == '':
+            return None
+        cached = self.last_known_good.get(visitor_code, flag_key)
+        if cached is None:
+            return None
+        variant, variables = cached
+        return self.__make_result(flag_key, default_value, variant, variables, requested_variable_key, Reason.STALE)
+
+    # pylint: disable=R0913
+    def __make_result(self, flag_key: str, default_value: Any, variant: str, variables: Dict[Any, Any],
+                      requested_variable_key: Any, reason: Reason) -> FlagResolutionDetails[Any]:
+        """
+        Creates a FlagResolutionDetails object from the variables of the variant.
+        :param flag_key:
+        :param default_value:
+        :param variant:
+        :param variables:
+        :param requested_variable_key:
+        :param reason:
+        :return FlagResolutionDetails:
+        """
+        variable_key = self.__get_variable_key(requested_variable_key, variables)
+        value = variables.get(variable_key)
+
+        if value is None or variable_key == '':
+            return self._create_error_response(default_value, ErrorCode.FLAG_NOT_FOUND,
+                                               self.__make_error_description(variant, variable_key), variant)
+
+        if type(value) is type(default_value):
+            return self.resolution_cache.get_success(flag_key, variant, variable_key, value, reason)
+        return self._create_error_response(default_value,
+                                           ErrorCode.TYPE_MISMATCH,
+                                           'The type of value received is different from the requested value.',
+                                           variant)
+
+    def __add_data(self, visitor_code: str, data: Sequence[Union[CustomData, Conversion]]) -> None:
+        """
+        Adds the Kameleoon data to the visitor. If only changed custom data is tracked, nothing is added when
+        there is no data, and the custom data is remembered as submitted only once it has been added.
+        :param visitor_code:
+        :param data:
+        :return None:
+        """
+        if self.custom_data_tracker is None:
+            self.client.add_data(visitor_code, *data)
+            return
+        if not data:
+            return
+        self.client.add_data(visitor_code, *data)
+        self.custom_data_tracker.mark_submitted(visitor_code, data)
+
+    def __get_variant(self, visitor_code: str, flag_key: str) -> str:
+        """
+        Returns the variant of the flag for the visitor, tracking the exposure unless it was already tracked
+        within the deduplication window.
+        :param visitor_code:
+        :param flag_key:
+        :return str:
+        """
+        if self.deduplicator is None:
+            return self.client.get_feature_variation_key(visitor_code, flag_key)
+        tracked_variant = self.deduplicator.get_tracked_variant(visitor_code, flag_key)
+        if tracked_variant is not None:
+            variant = self.client.get_variation(visitor_code, flag_key, track=False).key
+            if variant == tracked_variant:
+                return variant
+        variant = self.client.get_feature_variation_key(visitor_code, flag_key)
+        self.deduplicator.mark_tracked(visitor_code, flag_key, variant)
+        return variant
+
+    def __normalize_context(self, visitor_code: str, compiled: Optional[CompiledContext],
+                            evaluation_context: EvaluationContext
+                            ) -> Tuple[str, Sequence[Union[CustomData, Conversion]], Any]:
+        """
+        Extracts the Kameleoon data and requested variable key from the evaluation context of the visitor.
+        A compiled context is used as is, without any conversion. If a custom data tracker is set, only
+        the custom data which changed since the previous evaluation of the visitor is kept.
+        :param visitor_code: targeting key of the evaluation context
+        :param compiled: compiled context carried by the evaluation context, if any
+        :param evaluation_context:
+        :return Tuple[str, Sequence[Union[CustomData, Conversion]], Any]:
+        """
+        tracker = self.custom_data_tracker
+        if compiled is not None:
+            data: Sequence[Union[CustomData, Conversion]] = compiled.kameleoon_data
+            if tracker is not None:
+                data = tracker.select_changed(visitor_code, data)
+            return visitor_code, data, compiled.variable_key
+        if tracker is None:
+            data = DataConverter.to_kameleoon(evaluation_context)
+        else:
+            data = DataConverter.to_kameleoon(evaluation_context,
+                                              lambda values: tracker.select_changed(visitor_code, values))
+        return visitor_code, data, evaluation_context.attributes.get(KameleoonResolver.VARIABLE_KEY)
+
     @staticmethod
-    def __get_targeting_key(evaluation_context) -> Optional[str]:
+    def __get_targeting_key(evaluation_context: Optional[EvaluationContext]) -> Optional[str]:
         """
         Extracts the TargetingKey from the evaluation context.
         :param evaluation_context:
         :return Optional[str]:
         """
+        if evaluation_context is None:
+            return None
         targeting_key = evaluation_context.targeting_key
         if isinstance(targeting_key, str):
             return targeting_key
         return None
 
     @staticmethod
-    def __get_variable_key(context, variables) -> Optional[str]:
+    def __get_variable_key(variable_key, variables) -> Optional[str]:
         """
-        Extracts the variable key from the evaluation context.
-        :param context:
+        Returns the requested variable key, or the first variable key if none is requested.
+        :param variable_key:
         :param variables:
         :return Optional[str]:
         """
-        if context is None or not isinstance(context, EvaluationContext):
-            return None
-        variable_key = context.attributes.get(KameleoonResolver.VARIABLE_KEY)
         if variable_key is None or variable_key == '':
             variable_key = next(iter(variables.keys()), None)
         return variable_key
@@ -115,20 +354,14 @@ class KameleoonResolver(Resolver):
             return f"The variation '{variant}' has no variables"
         return f"The value for provided variable key '{variable_key}' isn't found in variation '{variant}'"
 
-    @staticmethod
-    def _create_error_response(default_value, error_code, error_message, variant=None) -> FlagResolutionDetails[Any]:
+    def _create_error_response(self, default_value, error_code, error_message, variant=None
+                               ) -> FlagResolutionDetails[Any]:
         """
-        Creates a FlagResolutionDetails object for error responses.
+        Creates a FlagResolutionDetails object for error responses, reusing an identical one if it is cached.
         :param default_value:
         :param error_code:
         :param error_message:
         :param variant:
         :return FlagResolutionDetails:
         """
-        return FlagResolutionDetails(
-            value=default_value,
-            error_code=error_code,
-            error_message=error_message,
-            reason=Reason.ERROR,
-            variant=variant
-        )
+        return self.resolution_cache.get_error(default_value, error_code, error_message, variant)
@@ -0,0 +1,142 @@
+""" Kameleoon OpenFeature """
+import random
+import threading
+import time
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional
+
+from openfeature.evaluation_context import EvaluationContext
+from openfeature.exception import ErrorCode
+from openfeature.flag_evaluation import FlagResolutionDetails
+
+from kameleoon_openfeature.context import CompiledContext
+
+
+class EvaluationTrace:
+    """
+    EvaluationTrace is a structured record of a single flag evaluation.
+
+    Stage timings are stored in milliseconds in the order the stages were passed, e.g.
+    `to_kameleoon`, `add_data`, `get_feature_variation_key`, `get_feature_variation_variables`.
+    The evaluated context is identified by its targeting key, and by its fingerprint if it is a compiled context.
+    """
+
+    # pylint: disable=R0902
+    def __init__(self, flag_key: str, targeting_key: Optional[str] = None,
+                 fingerprint: Optional[str] = None) -> None:
+        self.flag_key = flag_key
+        self.targeting_key = targeting_key
+        self.fingerprint = fingerprint
+        self.variant: Optional[str] = None
+        self.reason: Optional[str] = None
+        self.error_code: Optional[ErrorCode] = None
+        self.stages: Dict[str, float] = {}
+        self.duration_ms = 0.0
+        self.sampled = False
+        self.slow = False
+        self.timestamp = time.time()
+        self._started_at = time.perf_counter()
+        self._last_mark = self._started_at
+
+    def mark(self, stage: str) -> None:
+        """
+        Records the time elapsed since the previous stage.
+        :param stage:
+        :return None:
+        """
+        now = time.perf_counter()
+        self.stages[stage] = (now - self._last_mark) * 1000.0
+        self._last_mark = now
+
+    def finish(self) -> None:
+        """
+        Records the total duration of the evaluation.
+        :return None:
+        """
+        self.duration_ms = (time.perf_counter() - self._started_at) * 1000.0
+
+    def __repr__(self) -> str:
+        return (f"EvaluationTrace{{flag_key:'{self.flag_key}',targeting_key:'{self.targeting_key}',"
+                f"fingerprint:'{self.fingerprint}',variant:'{self.variant}',reason:{self.reason},"
+                f"error_code:{self.error_code},duration_ms:{self.duration_ms:.3f},stages:{self.stages},"
+                f"sampled:{self.sampled},slow:{self.slow}}}")
+
+
+class EvaluationTracer:
+    """
+    EvaluationTracer samples flag evaluations and keeps their traces in a bounded ring buffer.
+
+    A configurable fraction of evaluations is captured, and evaluations slower than the threshold
+    are always captured regardless of sampling. When the buffer is full the oldest traces are dropped.
+    """
+    DEFAULT_CAPACITY = 1000
+
+    def __init__(self, sample_rate: float = 0.0, slow_threshold_ms: Optional[float] = None,
+                 capacity: int = DEFAULT_CAPACITY) -> None:
+        """
+        :param sample_rate: fraction of evaluations to capture, from 0.0 (none) to 1.0 (all)
+        :param slow_threshold_ms: evaluations slower than this are always captured; `None` disables it
+        :param capacity: maximum number of traces kept in the ring buffer
+        """
+        if not 0.0 <= sample_rate <= 1.0:
+            raise ValueError(f"sample_rate must be within [0.0, 1.0], got {sample_rate}")
+        if capacity <= 0:
+            raise ValueError(f"capacity must be positive, got {capacity}")
+        self.sample_rate = sample_rate
+        self.slow_threshold_ms = slow_threshold_ms
+        self.__traces: Deque[EvaluationTrace] = deque(maxlen=capacity)
+        self.__lock = threading.Lock()
+
+    def begin(self, flag_key: str, evaluation_context: Optional[EvaluationContext] = None
+              ) -> Optional[EvaluationTrace]:
+        """
+        Starts a trace for the evaluation of the given flag for the given context.
+        :param flag_key:
+        :param evaluation_context:
+        :return Optional[EvaluationTrace]: `None` if the evaluation is not sampled and there is no slow
+            threshold, so it can't be captured.
+        """
+        sampled = self.sample_rate > 0.0 and random.random() < self.sample_rate
+        if not sampled and self.slow_threshold_ms is None:
+            return None
+        compiled = CompiledContext.find(evaluation_context)
+        if compiled is not None:
+            trace = EvaluationTrace(flag_key, compiled.visitor_code, compiled.fingerprint)
+        else:
+            targeting_key = evaluation_context.targeting_key if evaluation_context is not None else None
+            trace = EvaluationTrace(flag_key, targeting_key)
+        trace.sampled = sampled
+        return trace
+
+    def end(self, trace: EvaluationTrace, result: FlagResolutionDetails[Any]) -> None:
+        """
+        Completes the trace with the evaluation result and stores it if it was sampled or slow.
+        :param trace:
+        :param result:
+        :return None:
+        """
+        trace.finish()
+        trace.slow = self.slow_threshold_ms is not None and trace.duration_ms >= self.slow_threshold_ms
+        if not (trace.sampled or trace.slow):
+            return
+        trace.variant = result.variant
+        trace.reason = result.reason
+        trace.error_code = result.error_code
+        with self.__lock:
+            self.__traces.append(trace)
+
+    def get_traces(self) -> List[EvaluationTrace]:
+        """
+        Returns a snapshot of the captured traces, oldest first.
+        :return List[EvaluationTrace]:
+        """
+        with self.__lock:
+            return list(self.__traces)
+
+    def clear(self) -> None:
+        """
+        Removes all captured traces.
+        :return None:
+        """
+        with self.__lock:
+            self.__traces.clear()
@@ -0,0 +1,36 @@
+""" Kameleoon OpenFeature """
+import time
+from typing import Optional
+
+
+class WarmUpReport:
+    """
+    WarmUpReport summarizes the warm-up of the provider at initialization.
+
+    The warm-up walks all configured feature flags, assigns a variation of each flag to a synthetic visitor
+    without tracking it, fetches the variables of each variation and caches the resolution details of their
+    scalar values, so that the first evaluations after initialization pay fewer cold-path costs.
+    """
+
+    def __init__(self) -> None:
+        self.flags = 0
+        self.evaluated_flags = 0
+        self.variants = 0
+        self.cached_results = 0
+        self.failures = 0
+        self.error: Optional[str] = None
+        self.duration_ms = 0.0
+        self.timestamp = time.time()
+        self._started_at = time.perf_counter()
+
+    def finish(self) -> None:
+        """
+        Records the total duration of the warm-up.
+        :return None:
+        """
+        self.duration_ms = (time.perf_counter() - self._started_at) * 1000.0
+
+    def __repr__(self) -> str:
+        return (f"WarmUpReport{{flags:{self.flags},evaluated_flags:{self.evaluated_flags},variants:{self.variants},"
+                f"cached_results:{self.cached_results},failures:{self.failures},error:{self.error},"
+                f"duration_ms:{self.duration_ms:.3f}}}")
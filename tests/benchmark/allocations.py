@@ -0,0 +1,93 @@
+""" Benchmark of the memory allocated by KameleoonResolver per evaluation, measured with tracemalloc
+
+Example:
+    python -m tests.benchmark.allocations --evaluations 100000
+
+Each scenario is measured with the default ResolutionDetailsCache and with caching disabled, so that the
+difference shows the allocations saved by reusing immutable FlagResolutionDetails instances.
+"""
+import argparse
+import json
+import sys
+import tracemalloc
+from typing import Any, Dict, List, Optional, Sequence
+
+from openfeature.evaluation_context import EvaluationContext
+
+from kameleoon_openfeature.context import CompiledContext
+from kameleoon_openfeature.resolution_cache import ResolutionDetailsCache
+from kameleoon_openfeature.resolver import KameleoonResolver
+
+VISITOR_CODE = 'visitor'
+VARIABLES = {'value': 10}
+
+
+class FixedClient:  # pylint: disable=W0613
+    """
+    Stand-in for KameleoonClient returning the same variant and variables for every evaluation,
+    so that only the allocations of the provider are measured.
+    """
+    def add_data(self, visitor_code: str, *data: Any) -> None:
+        """Ignores the data."""
+
+    def get_feature_variation_key(self, visitor_code: str, flag_key: str) -> str:
+        """Returns the fixed variant."""
+        return 'on'
+
+    def get_feature_variation_variables(self, flag_key: str, variant: str) -> Dict[str, Any]:
+        """Returns the fixed variables."""
+        return VARIABLES
+
+
+SCENARIOS = {
+    'success': ('flag', 0, CompiledContext.compile(EvaluationContext(VISITOR_CODE, {'variableKey': 'value'}))),
+    'wrong_type': ('flag', '', CompiledContext.compile(EvaluationContext(VISITOR_CODE, {'variableKey': 'value'}))),
+    'missing_targeting_key': ('flag', 0, None),
+}
+
+
+def measure(resolver: KameleoonResolver, flag_key: str, default_value: Any,
+            context: Optional[EvaluationContext], evaluations: int) -> Dict[str, float]:
+    """
+    Returns the number of allocated blocks and bytes per evaluation. The results are kept alive during the
+    measurement, so that every result allocated by an evaluation is counted.
+    """
+    resolver.resolve(flag_key, default_value, context)
+    results: List[Any] = [None] * evaluations
+    tracemalloc.start()
+    try:
+        before = tracemalloc.take_snapshot()
+        for index in range(evaluations):
+            results[index] = resolver.resolve(flag_key, default_value, context)
+        after = tracemalloc.take_snapshot()
+    finally:
+        tracemalloc.stop()
+    stats = after.compare_to(before, 'filename')
+    return {
+        'blocks_per_evaluation': round(sum(stat.count_diff for stat in stats) / evaluations, 2),
+        'bytes_per_evaluation': round(sum(stat.size_diff for stat in stats) / evaluations, 1),
+    }
+
+
+def main(argv: Optional[Sequence[str]] = None) -> Dict[str, Any]:
+    """
+    Runs the benchmark and prints the report as JSON.
+    """
+    parser = argparse.ArgumentParser(description='Allocations per evaluation of KameleoonResolver')
+    parser.add_argument('--evaluations', type=int, default=10_000, help='number of evaluations per scenario')
+    args = parser.parse_args(argv)
+    report = {}
+    for name, (flag_key, default_value, context) in SCENARIOS.items():
+        report[name] = {
+            label: measure(KameleoonResolver(FixedClient(), resolution_cache=cache),
+                           flag_key, default_value, context, args.evaluations)
+            for label, cache in (('cached', ResolutionDetailsCache()),
+                                 ('uncached', ResolutionDetailsCache(max_entries=0, max_error_entries=0)))
+        }
+    json.dump(report, sys.stdout, indent=2)
+    sys.stdout.write('\n')
+    return report
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,13 @@
+import unittest
+
+from tests.benchmark.allocations import main
+
+
+class TestAllocationsSmoke(unittest.TestCase):
+    def test_cached_evaluations_allocate_less(self):
+        # act
+        report = main(['--evaluations', '200'])
+
+        # assert
+        for scenario in report.values():
+            self.assertLess(scenario['cached']['blocks_per_evaluation'], scenario['uncached']['blocks_per_evaluation'])
@@ -0,0 +1,292 @@
+""" Load-test driver running KameleoonProvider through the OpenFeature client against the stand-in server
+
+Example:
+    python -m tests.load.load_test --qps 2000 --threads 8 --duration 90 --bump-interval 30
+    python -m tests.load.load_test --qps 2000 --async-tasks 64 --init-storm-interval 5 --last-known-good
+    python -m tests.load.load_test --qps 2000 --threads 8 --init-storm-interval 5 --warm-up
+
+Evaluation latencies are reported overall and per phase, in order of precedence: `swap` (shortly after a new
+provider was set), `refresh` (shortly after the SDK fetched the configuration), `tracking` (shortly after the SDK
+sent tracking data) and `steady` (none of the above).
+
+With `--async-tasks`, the tasks evaluate through the asynchronous API of the OpenFeature client
+(`get_integer_details_async`), which awaits the asynchronous resolution methods of the provider.
+"""
+import argparse
+import asyncio
+import bisect
+import json
+import random
+import sys
+import threading
+import time
+from collections import Counter
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from kameleoon import KameleoonClientConfig
+from openfeature import api
+from openfeature.client import OpenFeatureClient
+from openfeature.evaluation_context import EvaluationContext
+from openfeature.flag_evaluation import FlagEvaluationDetails
+from openfeature.provider import ProviderStatus
+
+from kameleoon_openfeature.kameleoon_provider import KameleoonProvider
+from kameleoon_openfeature.last_known_good import LastKnownGoodStore
+from tests.load.stand_in_server import VARIABLE_KEY, StandInServer, redirect_kameleoon_sdk
+
+Sample = Tuple[float, float, str]
+
+
+class LatencyRecorder:
+    """
+    Collects evaluation samples: start time, latency in seconds and outcome (reason or error code).
+    """
+    def __init__(self) -> None:
+        self.samples: List[Sample] = []
+        self.__lock = threading.Lock()
+
+    def record(self, started_at: float, latency: float, outcome: str) -> None:
+        """
+        Records an evaluation sample.
+        """
+        with self.__lock:
+            self.samples.append((started_at, latency, outcome))
+
+
+class LoadTest:
+    """
+    LoadTest drives evaluations at the configured rate while the stand-in server and provider swaps
+    exercise configuration refreshes, initialization storms and tracking bursts.
+    """
+    def __init__(self, args: argparse.Namespace, server: StandInServer) -> None:
+        self.args = args
+        self.server = server
+        self.recorder = LatencyRecorder()
+        self.swap_times: List[float] = []
+        self.providers: List[KameleoonProvider] = []
+        self.last_known_good = LastKnownGoodStore() if args.last_known_good else None
+        self.visitors = [f'visitor_{index}' for index in range(args.visitors)]
+        self.flags = [f'flag_{index}' for index in range(server.flag_count)]
+        self.__providers = 0
+        self.__stop = threading.Event()
+
+    def make_provider(self) -> KameleoonProvider:
+        """
+        Creates a provider with its own site code, so that each provider initializes a new SDK client.
+        """
+        self.__providers += 1
+        config = KameleoonClientConfig(
+            'clientId', 'clientSecret',
+            refresh_interval_minute=self.args.refresh_interval_minute,
+            tracking_interval_millisecond=self.args.tracking_interval_ms,
+        )
+        provider = KameleoonProvider(f'{self.args.site_code}{self.__providers}', config=config,
+                                     last_known_good=self.last_known_good, warm_up=self.args.warm_up)
+        self.providers.append(provider)
+        return provider
+
+    def evaluate(self, client: OpenFeatureClient) -> None:
+        """
+        Evaluates a random flag for a random visitor and records the sample.
+        """
+        flag_key, context = self.__make_evaluation()
+        started_at = time.monotonic()
+        details = client.get_integer_details(flag_key, -1, context)
+        self.__record(started_at, details)
+
+    async def evaluate_async(self, client: OpenFeatureClient) -> None:
+        """
+        Evaluates a random flag for a random visitor through the asynchronous API and records the sample.
+        """
+        flag_key, context = self.__make_evaluation()
+        started_at = time.monotonic()
+        details = await client.get_integer_details_async(flag_key, -1, context)
+        self.__record(started_at, details)
+
+    def run(self) -> Dict[str, Any]:
+        """
+        Runs the load test and returns the report.
+        """
+        api.set_provider(self.make_provider())
+        client = api.get_client()
+        wait_until_ready(client, self.args.init_timeout)
+        background = [threading.Thread(target=self.__bump_configuration, daemon=True),
+                      threading.Thread(target=self.__storm_providers, daemon=True)]
+        for thread in background:
+            thread.start()
+        started_at = time.monotonic()
+        stop_at = started_at + self.args.duration
+        if self.args.async_tasks > 0:
+            asyncio.run(self.__run_tasks(client, stop_at))
+        else:
+            self.__run_threads(client, stop_at)
+        elapsed = time.monotonic() - started_at
+        self.__stop.set()
+        for thread in background:
+            thread.join()
+        time.sleep(self.args.tracking_interval_ms / 1000.0)
+        api.shutdown()
+        return self.report(elapsed)
+
+    def report(self, elapsed: float) -> Dict[str, Any]:
+        """
+        Summarizes the samples overall and per phase.
+        """
+        samples = self.recorder.samples
+        window = self.args.phase_window
+        markers = {
+            'swap': sorted(self.swap_times),
+            'refresh': sorted(self.server.stats.configuration_request_times),
+            'tracking': sorted(self.server.stats.tracking_request_times),
+        }
+        phases: Dict[str, List[float]] = {phase: [] for phase in (*markers, 'steady')}
+        for sample_started_at, latency, _ in samples:
+            phase = next((name for name, times in markers.items() if is_within(times, sample_started_at, window)),
+                         'steady')
+            phases[phase].append(latency)
+        return {
+            'evaluations': len(samples),
+            'achieved_qps': round(len(samples) / elapsed, 1) if elapsed > 0 else 0.0,
+            'outcomes': dict(Counter(outcome for _, _, outcome in samples)),
+            'latency_ms': summarize([latency for _, latency, _ in samples]),
+            'phases_latency_ms': {phase: summarize(latencies) for phase, latencies in phases.items()},
+            'providers': self.__providers,
+            'warm_up_ms': [round(report.duration_ms, 3) for report in
+                           (provider.get_warm_up_report() for provider in self.providers) if report is not None],
+            'configuration_revision': self.server.revision,
+            'stand_in': self.server.stats.as_dict(),
+        }
+
+    def __make_evaluation(self) -> Tuple[str, EvaluationContext]:
+        return random.choice(self.flags), EvaluationContext(random.choice(self.visitors), {'variableKey': VARIABLE_KEY})
+
+    def __record(self, started_at: float, details: FlagEvaluationDetails[int]) -> None:
+        latency = time.monotonic() - started_at
+        outcome = details.error_code.value if details.error_code is not None else str(details.reason)
+        self.recorder.record(started_at, latency, outcome)
+
+    def __run_threads(self, client: OpenFeatureClient, stop_at: float) -> None:
+        interval = self.args.threads / self.args.qps
+        workers = [threading.Thread(target=self.__thread_worker, args=(client, stop_at, interval))
+                   for _ in range(self.args.threads)]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+
+    def __thread_worker(self, client: OpenFeatureClient, stop_at: float, interval: float) -> None:
+        next_at = time.monotonic() + random.random() * interval
+        while next_at < stop_at:
+            delay = next_at - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+            self.evaluate(client)
+            next_at += interval
+
+    async def __run_tasks(self, client: OpenFeatureClient, stop_at: float) -> None:
+        interval = self.args.async_tasks / self.args.qps
+        await asyncio.gather(*(self.__task_worker(client, stop_at, interval) for _ in range(self.args.async_tasks)))
+
+    async def __task_worker(self, client: OpenFeatureClient, stop_at: float, interval: float) -> None:
+        next_at = time.monotonic() + random.random() * interval
+        while next_at < stop_at:
+            await asyncio.sleep(max(0.0, next_at - time.monotonic()))
+            await self.evaluate_async(client)
+            next_at += interval
+
+    def __bump_configuration(self) -> None:
+        while self.args.bump_interval > 0 and not self.__stop.wait(self.args.bump_interval):
+            self.server.bump_configuration()
+
+    def __storm_providers(self) -> None:
+        while self.args.init_storm_interval > 0 and not self.__stop.wait(self.args.init_storm_interval):
+            self.swap_times.append(time.monotonic())
+            api.set_provider(self.make_provider())
+
+
+def wait_until_ready(client: OpenFeatureClient, timeout: float) -> None:
+    """
+    Waits until the provider of the client is ready.
+    """
+    deadline = time.monotonic() + timeout
+    while client.get_provider_status() != ProviderStatus.READY:
+        if time.monotonic() > deadline:
+            raise TimeoutError(f'The provider is not ready after {timeout} seconds')
+        time.sleep(0.01)
+
+
+def is_within(times: Sequence[float], moment: float, window: float) -> bool:
+    """
+    Returns whether the moment is within `window` seconds after any of the sorted times.
+    """
+    index = bisect.bisect_right(times, moment)
+    return index > 0 and moment - times[index - 1] <= window
+
+
+def summarize(latencies: List[float]) -> Optional[Dict[str, float]]:
+    """
+    Returns the count and the latency percentiles in milliseconds.
+    """
+    if not latencies:
+        return None
+    ordered = sorted(latencies)
+
+    def percentile(fraction: float) -> float:
+        return round(ordered[min(len(ordered) - 1, int(fraction * len(ordered)))] * 1000.0, 3)
+
+    return {'count': len(ordered), 'p50': percentile(0.5), 'p90': percentile(0.9), 'p99': percentile(0.99),
+            'p999': percentile(0.999), 'max': round(ordered[-1] * 1000.0, 3)}
+
+
+def parse_args(argv: Optional[Sequence[str]] = None) -> argparse.Namespace:
+    """
+    Parses the command line arguments.
+    """
+    parser = argparse.ArgumentParser(description='Load test of KameleoonProvider against a local stand-in server')
+    parser.add_argument('--qps', type=float, default=500.0, help='target evaluations per second')
+    parser.add_argument('--duration', type=float, default=30.0, help='duration of the load in seconds')
+    parser.add_argument('--threads', type=int, default=4, help='number of evaluating threads')
+    parser.add_argument('--async-tasks', type=int, default=0,
+                        help='number of asyncio tasks evaluating through the async API, replaces threads if positive')
+    parser.add_argument('--flags', type=int, default=10, help='number of feature flags in the configuration')
+    parser.add_argument('--visitors', type=int, default=1000, help='number of distinct visitors')
+    parser.add_argument('--site-code', default='loadTestSite', help='prefix of the site codes')
+    parser.add_argument('--refresh-interval-minute', type=int, default=1,
+                        help='configuration refresh interval of the SDK')
+    parser.add_argument('--bump-interval', type=float, default=0.0,
+                        help='seconds between configuration changes on the stand-in server, 0 disables')
+    parser.add_argument('--init-storm-interval', type=float, default=0.0,
+                        help='seconds between swaps to a new provider, 0 disables')
+    parser.add_argument('--last-known-good', action='store_true',
+                        help='share a LastKnownGoodStore between the swapped providers')
+    parser.add_argument('--warm-up', action='store_true',
+                        help='warm up the evaluations of all flags when a provider initializes')
+    parser.add_argument('--tracking-interval-ms', type=int, default=1000, help='tracking interval of the SDK')
+    parser.add_argument('--configuration-delay-ms', type=float, default=0.0,
+                        help='latency added by the stand-in server to configuration responses')
+    parser.add_argument('--tracking-delay-ms', type=float, default=0.0,
+                        help='latency added by the stand-in server to tracking responses')
+    parser.add_argument('--phase-window', type=float, default=1.0,
+                        help='seconds after a refresh, tracking call or swap attributed to that phase')
+    parser.add_argument('--init-timeout', type=float, default=10.0, help='seconds to wait for the first provider')
+    args = parser.parse_args(argv)
+    if args.qps <= 0 or args.duration <= 0 or args.threads <= 0 or args.async_tasks < 0:
+        parser.error('qps, duration and threads must be positive, async-tasks must not be negative')
+    return args
+
+
+def main(argv: Optional[Sequence[str]] = None) -> Dict[str, Any]:
+    """
+    Runs the load test and prints the report as JSON.
+    """
+    args = parse_args(argv)
+    with StandInServer(args.flags, args.configuration_delay_ms, args.tracking_delay_ms) as server, \
+            redirect_kameleoon_sdk(server.base_url):
+        report = LoadTest(args, server).run()
+    json.dump(report, sys.stdout, indent=2)
+    sys.stdout.write('\n')
+    return report
+
+
+if __name__ == '__main__':
+    main()
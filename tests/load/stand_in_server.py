@@ -0,0 +1,262 @@
+""" Local stand-in for the Kameleoon configuration, authentication and tracking endpoints """
+import contextlib
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, Iterator, List
+from urllib.parse import urlsplit, urlunsplit
+
+from kameleoon.network.url_provider import UrlProvider
+
+VARIABLE_KEY = 'value'
+VARIATIONS = ('off', 'on')
+
+
+def make_configuration(flag_count: int, revision: int = 0) -> Dict[str, Any]:
+    """
+    Builds a Kameleoon configuration with `flag_count` feature flags `flag_0`..`flag_{n-1}`.
+
+    Each flag has the variations `off` and `on` split 50/50 by an experimentation rule, and each variation
+    has a single NUMBER variable `value` whose value depends on the revision, so that a refresh is observable.
+    """
+    feature_flags = []
+    for index in range(flag_count):
+        variations = [
+            {'key': key, 'variables': [{'key': VARIABLE_KEY, 'type': 'NUMBER', 'value': revision * 10 + offset}]}
+            for offset, key in enumerate(VARIATIONS)
+        ]
+        rule = {
+            'id': index + 1,
+            'order': 1,
+            'type': 'EXPERIMENTATION',
+            'exposition': 1.0,
+            'experimentId': 1000 + index,
+            'variationByExposition': [
+                {'variationKey': key, 'variationId': 10 * (index + 1) + offset, 'exposition': 0.5}
+                for offset, key in enumerate(VARIATIONS)
+            ],
+        }
+        feature_flags.append({
+            'id': index + 1,
+            'featureKey': f'flag_{index}',
+            'defaultVariationKey': VARIATIONS[0],
+            'environmentEnabled': True,
+            'variations': variations,
+            'rules': [rule],
+        })
+    return {
+        'configuration': {'realTimeUpdate': False},
+        'customData': [],
+        'segments': [],
+        'featureFlags': feature_flags,
+        'dateModified': revision,
+    }
+
+
+class StandInStats:
+    """
+    Counters of the requests handled by the stand-in server.
+    """
+    def __init__(self) -> None:
+        self.configuration_requests = 0
+        self.configuration_request_times: List[float] = []
+        self.token_requests = 0
+        self.tracking_requests = 0
+        self.tracking_request_times: List[float] = []
+        self.tracking_lines = 0
+        self.tracking_bytes = 0
+        self.other_requests = 0
+
+    def as_dict(self) -> Dict[str, Any]:
+        """
+        Returns the counters as a dictionary.
+        """
+        return {
+            'configuration_requests': self.configuration_requests,
+            'token_requests': self.token_requests,
+            'tracking_requests': self.tracking_requests,
+            'tracking_lines': self.tracking_lines,
+            'tracking_bytes': self.tracking_bytes,
+            'other_requests': self.other_requests,
+        }
+
+
+class StandInServer:
+    """
+    StandInServer serves a generated Kameleoon configuration and accepts tracking calls on a local port.
+
+    Use `redirect_kameleoon_sdk` to send the requests of the Kameleoon SDK to it.
+    """
+
+    # pylint: disable=R0913
+    def __init__(self, flag_count: int = 10, configuration_delay_ms: float = 0.0,
+                 tracking_delay_ms: float = 0.0, host: str = '127.0.0.1', port: int = 0) -> None:
+        self.flag_count = flag_count
+        self.configuration_delay_ms = configuration_delay_ms
+        self.tracking_delay_ms = tracking_delay_ms
+        self.stats = StandInStats()
+        self.__revision = 0
+        self.__configuration = json.dumps(make_configuration(flag_count)).encode('utf-8')
+        self.__lock = threading.Lock()
+        self.__server = ThreadingHTTPServer((host, port), self.__make_handler())
+        self.__server.daemon_threads = True
+        self.__thread = threading.Thread(target=self.__server.serve_forever, daemon=True)
+
+    @property
+    def base_url(self) -> str:
+        """
+        Returns the base URL of the server, e.g. `http://127.0.0.1:8080`.
+        """
+        host, port = self.__server.server_address[:2]
+        return f'http://{host}:{port}'
+
+    @property
+    def revision(self) -> int:
+        """
+        Returns the revision of the served configuration.
+        """
+        return self.__revision
+
+    def bump_configuration(self) -> None:
+        """
+        Changes the values of all variables, so that the next refresh of the SDK loads a new configuration.
+        """
+        with self.__lock:
+            self.__revision += 1
+            self.__configuration = json.dumps(make_configuration(self.flag_count, self.__revision)).encode('utf-8')
+
+    def start(self) -> 'StandInServer':
+        """
+        Starts serving requests in a background thread.
+        """
+        self.__thread.start()
+        return self
+
+    def stop(self) -> None:
+        """
+        Stops the server.
+        """
+        self.__server.shutdown()
+        self.__server.server_close()
+
+    def serve_configuration(self) -> bytes:
+        """
+        Records a configuration request and returns the configuration, after the configured delay.
+        """
+        with self.__lock:
+            self.stats.configuration_requests += 1
+            self.stats.configuration_request_times.append(time.monotonic())
+            body = self.__configuration
+        if self.configuration_delay_ms > 0:
+            time.sleep(self.configuration_delay_ms / 1000.0)
+        return body
+
+    def serve_access_token(self) -> bytes:
+        """
+        Records an access token request and returns a token.
+        """
+        with self.__lock:
+            self.stats.token_requests += 1
+        return json.dumps({'access_token': 'stand-in-token', 'expires_in': 3600}).encode('utf-8')
+
+    def accept_tracking(self, body: bytes) -> None:
+        """
+        Records a tracking request, after the configured delay.
+        """
+        if self.tracking_delay_ms > 0:
+            time.sleep(self.tracking_delay_ms / 1000.0)
+        with self.__lock:
+            self.stats.tracking_requests += 1
+            self.stats.tracking_request_times.append(time.monotonic())
+            self.stats.tracking_lines += len(body.splitlines())
+            self.stats.tracking_bytes += len(body)
+
+    def reject(self) -> None:
+        """
+        Records an unexpected request.
+        """
+        with self.__lock:
+            self.stats.other_requests += 1
+
+    def __enter__(self) -> 'StandInServer':
+        return self.start()
+
+    def __exit__(self, *args: Any) -> None:
+        self.stop()
+
+    def __make_handler(self) -> type:
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            """
+            Routes the requests of the Kameleoon SDK.
+            """
+            protocol_version = 'HTTP/1.1'
+
+            def do_GET(self) -> None:  # pylint: disable=C0103
+                """Serves the configuration."""
+                if urlsplit(self.path).path.endswith('/sse'):
+                    self.__respond(404, b'')
+                    return
+                self.__respond(200, server.serve_configuration(), 'application/json')
+
+            def do_POST(self) -> None:  # pylint: disable=C0103
+                """Accepts access token and tracking requests."""
+                path = urlsplit(self.path).path
+                body = self.rfile.read(int(self.headers.get('Content-Length', 0)))
+                if path.endswith('/oauth/token'):
+                    self.__respond(200, server.serve_access_token(), 'application/json')
+                elif path.endswith('/visit/events'):
+                    server.accept_tracking(body)
+                    self.__respond(204, b'')
+                else:
+                    server.reject()
+                    self.__respond(404, b'')
+
+            def __respond(self, code: int, body: bytes, content_type: str = 'text/plain') -> None:
+                self.send_response(code)
+                self.send_header('Content-Type', content_type)
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                if body:
+                    self.wfile.write(body)
+
+            def log_message(self, *args: Any) -> None:  # pylint: disable=W0221
+                """Silences the access log."""
+
+        return Handler
+
+
+@contextlib.contextmanager
+def redirect_kameleoon_sdk(base_url: str) -> Iterator[None]:
+    """
+    Redirects every URL built by the Kameleoon SDK clients created within the context to the given base URL,
+    keeping the path and the query.
+
+    The SDK builds its URLs with the public `make_*_url` methods of the `UrlProvider` of each client. They are
+    wrapped on every `UrlProvider` instance created within the context, rather than on the class, so that the
+    clients, which can't be stopped, keep being redirected after the context exits and their background jobs
+    never reach the Kameleoon servers.
+    """
+    target = urlsplit(base_url)
+    names = [name for name, method in vars(UrlProvider).items()
+             if name.startswith('make_') and name.endswith('_url') and callable(method)]
+    original_init = UrlProvider.__init__
+
+    def wrap(method):
+        def redirected(*args, **kwargs):
+            url = urlsplit(method(*args, **kwargs))
+            return urlunsplit((target.scheme, target.netloc, url.path, url.query, url.fragment))
+        return redirected
+
+    def init(url_provider: UrlProvider, *args: Any, **kwargs: Any) -> None:
+        original_init(url_provider, *args, **kwargs)
+        for name in names:
+            setattr(url_provider, name, wrap(getattr(url_provider, name)))
+
+    setattr(UrlProvider, '__init__', init)
+    try:
+        yield
+    finally:
+        setattr(UrlProvider, '__init__', original_init)
@@ -0,0 +1,66 @@
+import unittest
+from unittest.mock import patch
+
+from kameleoon_openfeature.kameleoon_provider import KameleoonProvider
+from openfeature import api
+from openfeature.client import OpenFeatureClient
+from openfeature.evaluation_context import EvaluationContext
+from openfeature.flag_evaluation import Reason
+
+from tests.load.load_test import LoadTest, parse_args, wait_until_ready
+from tests.load.stand_in_server import VARIABLE_KEY, StandInServer, redirect_kameleoon_sdk
+
+
+class TestLoadSmoke(unittest.TestCase):
+    def test_provider_evaluates_flags_served_by_stand_in_server(self):
+        # arrange
+        with StandInServer(flag_count=2) as server, redirect_kameleoon_sdk(server.base_url):
+            args = parse_args(['--duration', '0.2', '--warm-up'])
+            load_test = LoadTest(args, server)
+            provider = load_test.make_provider()
+            self.assertIsInstance(provider, KameleoonProvider)
+            api.set_provider(provider)
+            client = api.get_client()
+
+            # act
+            wait_until_ready(client, args.init_timeout)
+            details = client.get_integer_details('flag_1', -1, EvaluationContext('visitor', {'variableKey': VARIABLE_KEY}))
+            api.shutdown()
+
+        # assert
+        self.assertEqual(Reason.STATIC, details.reason)
+        self.assertIn(details.value, (0, 1))
+        self.assertEqual(1, server.stats.configuration_requests)
+        warm_up_report = provider.get_warm_up_report()
+        self.assertEqual(2, warm_up_report.flags)
+        self.assertEqual(4, warm_up_report.cached_results)
+
+    def test_load_test_reports_latencies(self):
+        # arrange
+        with StandInServer(flag_count=2) as server, redirect_kameleoon_sdk(server.base_url):
+            args = parse_args(['--qps', '200', '--threads', '2', '--duration', '0.5', '--tracking-interval-ms', '1000'])
+
+            # act
+            report = LoadTest(args, server).run()
+
+        # assert
+        self.assertGreater(report['evaluations'], 0)
+        self.assertEqual(report['evaluations'], report['outcomes'].get('STATIC'), report['outcomes'])
+        self.assertEqual(report['evaluations'], report['latency_ms']['count'])
+        self.assertGreater(report['stand_in']['tracking_requests'], 0)
+
+    def test_load_test_evaluates_through_async_api(self):
+        # arrange
+        with StandInServer(flag_count=2) as server, redirect_kameleoon_sdk(server.base_url):
+            args = parse_args(['--qps', '200', '--async-tasks', '4', '--duration', '0.3'])
+            load_test = LoadTest(args, server)
+
+            # act
+            with patch.object(OpenFeatureClient, 'get_integer_details_async',
+                              autospec=True, side_effect=OpenFeatureClient.get_integer_details_async) as async_mock:
+                report = load_test.run()
+
+        # assert
+        self.assertGreater(report['evaluations'], 0)
+        self.assertEqual(report['evaluations'], report['outcomes'].get('STATIC'), report['outcomes'])
+        self.assertEqual(report['evaluations'], async_mock.call_count)
@@ -0,0 +1,248 @@
+import threading
+import unittest
+from unittest.mock import Mock, patch
+
+from kameleoon.exceptions import FeatureNotFound, VisitorCodeInvalid
+from openfeature.evaluation_context import EvaluationContext
+from openfeature.exception import ErrorCode
+from openfeature.flag_evaluation import Reason
+
+from kameleoon_openfeature.circuit_breaker import CircuitBreaker
+from kameleoon_openfeature.custom_data_tracker import CustomDataTracker
+from kameleoon_openfeature.last_known_good import LastKnownGoodStore
+from kameleoon_openfeature.resolver import KameleoonResolver
+from kameleoon_openfeature.types import Data
+
+
+class TestCircuitBreaker(unittest.TestCase):
+    def test_invalid_arguments_raise_value_error(self):
+        # assert
+        with self.assertRaises(ValueError):
+            CircuitBreaker(failure_threshold=0)
+        with self.assertRaises(ValueError):
+            CircuitBreaker(recovery_timeout_seconds=-1)
+
+    def test_circuit_opens_after_consecutive_failures(self):
+        # arrange
+        breaker = CircuitBreaker(failure_threshold=2)
+
+        # act
+        breaker.record_failure()
+        breaker.record_success()
+        breaker.record_failure()
+        state_after_reset = breaker.state
+        breaker.record_failure()
+
+        # assert
+        self.assertEqual(CircuitBreaker.State.CLOSED, state_after_reset)
+        self.assertEqual(CircuitBreaker.State.OPEN, breaker.state)
+        self.assertFalse(breaker.allow_request())
+
+    def test_trial_request_after_recovery_timeout_without_probe(self):
+        # arrange
+        breaker = CircuitBreaker(failure_threshold=1, recovery_timeout_seconds=10.0)
+        with patch('kameleoon_openfeature.circuit_breaker.time.monotonic', return_value=0.0):
+            breaker.record_failure()
+
+        # act
+        with patch('kameleoon_openfeature.circuit_breaker.time.monotonic', return_value=5.0):
+            before_timeout = breaker.allow_request()
+        with patch('kameleoon_openfeature.circuit_breaker.time.monotonic', return_value=11.0):
+            trial = breaker.allow_request()
+            concurrent = breaker.allow_request()
+            breaker.record_success()
+
+        # assert
+        self.assertFalse(before_timeout)
+        self.assertTrue(trial)
+        self.assertFalse(concurrent)
+        self.assertEqual(CircuitBreaker.State.CLOSED, breaker.state)
+
+    def test_failed_trial_reopens_circuit(self):
+        # arrange
+        breaker = CircuitBreaker(failure_threshold=1, recovery_timeout_seconds=0.0)
+        breaker.record_failure()
+
+        # act
+        trial = breaker.allow_request()
+        breaker.record_failure()
+
+        # assert
+        self.assertTrue(trial)
+        self.assertEqual(CircuitBreaker.State.OPEN, breaker.state)
+
+    def test_probe_runs_in_background_before_trial(self):
+        for healthy in (True, False):
+            # arrange
+            probe_threads = []
+            thread_class = threading.Thread
+
+            def make_thread(*args, thread_class=thread_class, **kwargs):
+                thread = thread_class(*args, **kwargs)
+                probe_threads.append(thread)
+                return thread
+
+            breaker = CircuitBreaker(failure_threshold=1, recovery_timeout_seconds=0.0, probe=lambda r=healthy: r)
+            breaker.record_failure()
+
+            # act
+            with patch('kameleoon_openfeature.circuit_breaker.threading.Thread', side_effect=make_thread):
+                allowed = breaker.allow_request()
+            self.assertEqual(1, len(probe_threads))
+            probe_threads[0].join(1.0)
+
+            # assert
+            self.assertFalse(allowed)
+            expected_state = CircuitBreaker.State.HALF_OPEN if healthy else CircuitBreaker.State.OPEN
+            self.assertEqual(expected_state, breaker.state)
+
+    def test_released_trial_lets_another_trial_through(self):
+        # arrange
+        breaker = CircuitBreaker(failure_threshold=1, recovery_timeout_seconds=0.0)
+        breaker.record_failure()
+
+        # act
+        trial = breaker.allow_request()
+        breaker.release()
+        other_trial = breaker.allow_request()
+
+        # assert
+        self.assertTrue(trial)
+        self.assertTrue(other_trial)
+        self.assertEqual(CircuitBreaker.State.HALF_OPEN, breaker.state)
+
+    def test_resolver_short_circuits_when_circuit_is_open(self):
+        # arrange
+        client_mock = Mock()
+        client_mock.get_feature_variation_key.side_effect = RuntimeError('degraded')
+        breaker = CircuitBreaker(failure_threshold=2, recovery_timeout_seconds=60.0)
+        resolver = KameleoonResolver(client_mock, circuit_breaker=breaker)
+        context = EvaluationContext(targeting_key='visitor')
+
+        # act
+        results = [resolver.resolve('flagKey', 5, context) for _ in range(4)]
+
+        # assert
+        self.assertEqual(2, client_mock.get_feature_variation_key.call_count)
+        self.assertEqual([5, 5, 5, 5], [result.value for result in results])
+        self.assertEqual('degraded', results[0].error_message)
+        self.assertEqual(KameleoonResolver.CIRCUIT_OPEN_MESSAGE, results[3].error_message)
+        self.assertEqual(ErrorCode.GENERAL, results[3].error_code)
+        self.assertEqual(Reason.ERROR, results[3].reason)
+
+    def test_resolver_does_not_count_flag_errors_as_failures(self):
+        # arrange
+        client_mock = Mock()
+        client_mock.get_feature_variation_key.return_value = 'on'
+        client_mock.get_feature_variation_variables.return_value = {}
+        breaker = CircuitBreaker(failure_threshold=1)
+        resolver = KameleoonResolver(client_mock, circuit_breaker=breaker)
+
+        # act
+        result = resolver.resolve('flagKey', 5, EvaluationContext(targeting_key='visitor'))
+
+        # assert
+        self.assertEqual(ErrorCode.FLAG_NOT_FOUND, result.error_code)
+        self.assertEqual(CircuitBreaker.State.CLOSED, breaker.state)
+
+    def test_resolver_counts_flags_not_found_before_configuration_is_loaded_as_failures(self):
+        # arrange
+        client_mock = Mock()
+        client_mock.get_feature_variation_key.side_effect = FeatureNotFound('flagKey')
+        client_mock.get_feature_list.return_value = []
+        breaker = CircuitBreaker(failure_threshold=2, recovery_timeout_seconds=60.0)
+        last_known_good = LastKnownGoodStore()
+        last_known_good.save('visitor', 'flagKey', 'on', {'k': 10})
+        resolver = KameleoonResolver(client_mock, circuit_breaker=breaker, last_known_good=last_known_good)
+
+        # act
+        stale_result = resolver.resolve('flagKey', 5, EvaluationContext(targeting_key='visitor'))
+        error_result = resolver.resolve('flagKey', 5, EvaluationContext(targeting_key='otherVisitor'))
+
+        # assert
+        self.assertEqual(10, stale_result.value)
+        self.assertEqual(Reason.STALE, stale_result.reason)
+        self.assertEqual(ErrorCode.GENERAL, error_result.error_code)
+        self.assertEqual(KameleoonResolver.NOT_LOADED_MESSAGE, error_result.error_message)
+        self.assertEqual(CircuitBreaker.State.OPEN, breaker.state)
+
+    def test_resolver_ignores_evaluations_not_reaching_sdk(self):
+        # arrange
+        client_mock = Mock()
+        client_mock.get_feature_variation_key.side_effect = RuntimeError('degraded')
+        breaker = CircuitBreaker(failure_threshold=3, recovery_timeout_seconds=60.0)
+        resolver = KameleoonResolver(client_mock, circuit_breaker=breaker)
+        context = EvaluationContext(targeting_key='visitor')
+
+        # act
+        for _ in range(3):
+            resolver.resolve('flagKey', 5, context)
+            anonymous_result = resolver.resolve('flagKey', 5, EvaluationContext())
+
+        # assert
+        self.assertEqual(ErrorCode.TARGETING_KEY_MISSING, anonymous_result.error_code)
+        self.assertEqual(CircuitBreaker.State.OPEN, breaker.state)
+
+    def test_evaluation_not_reaching_sdk_does_not_use_trial(self):
+        # arrange
+        client_mock = Mock()
+        client_mock.get_feature_variation_key.side_effect = RuntimeError('degraded')
+        breaker = CircuitBreaker(failure_threshold=1, recovery_timeout_seconds=0.0)
+        resolver = KameleoonResolver(client_mock, circuit_breaker=breaker)
+        resolver.resolve('flagKey', 5, EvaluationContext(targeting_key='visitor'))
+
+        # act
+        resolver.resolve('flagKey', 5, EvaluationContext())
+        state_after_anonymous = breaker.state
+        client_mock.add_data.side_effect = VisitorCodeInvalid('invalid')
+        invalid_result = resolver.resolve('flagKey', 5, EvaluationContext(targeting_key='visitor'))
+        client_mock.add_data.side_effect = None
+        trial_result = resolver.resolve('flagKey', 5, EvaluationContext(targeting_key='visitor'))
+
+        # assert
+        self.assertEqual(CircuitBreaker.State.OPEN, state_after_anonymous)
+        self.assertEqual(ErrorCode.INVALID_CONTEXT, invalid_result.error_code)
+        self.assertEqual('degraded', trial_result.error_message)
+        self.assertEqual(2, client_mock.get_feature_variation_key.call_count)
+        self.assertEqual(CircuitBreaker.State.OPEN, breaker.state)
+
+    def test_short_circuited_evaluation_does_not_convert_context(self):
+        # arrange
+        client_mock = Mock()
+        tracker = CustomDataTracker()
+        breaker = CircuitBreaker(failure_threshold=1, recovery_timeout_seconds=60.0)
+        resolver = KameleoonResolver(client_mock, circuit_breaker=breaker, custom_data_tracker=tracker)
+        breaker.record_failure()
+        context = EvaluationContext(targeting_key='visitor', attributes={
+            Data.Type.CUSTOM_DATA: {Data.CustomDataType.INDEX: 1, Data.CustomDataType.VALUES: 'a'}
+        })
+
+        # act
+        with patch('kameleoon_openfeature.resolver.DataConverter.to_kameleoon') as to_kameleoon_mock:
+            result = resolver.resolve('flagKey', 5, context)
+        breaker.reset()
+        resolver.resolve('flagKey', 5, context)
+
+        # assert
+        self.assertEqual(KameleoonResolver.CIRCUIT_OPEN_MESSAGE, result.error_message)
+        to_kameleoon_mock.assert_not_called()
+        client_mock.add_data.assert_called_once()
+
+    def test_failed_context_conversion_does_not_use_trial(self):
+        # arrange
+        client_mock = Mock()
+        client_mock.get_feature_variation_key.side_effect = RuntimeError('degraded')
+        breaker = CircuitBreaker(failure_threshold=1, recovery_timeout_seconds=0.0)
+        resolver = KameleoonResolver(client_mock, circuit_breaker=breaker)
+        resolver.resolve('flagKey', 5, EvaluationContext(targeting_key='visitor'))
+
+        # act
+        with patch('kameleoon_openfeature.resolver.DataConverter.to_kameleoon', side_effect=ValueError('invalid')):
+            result = resolver.resolve('flagKey', 5, EvaluationContext(targeting_key='visitor'))
+        trial_allowed = breaker.allow_request()
+
+        # assert
+        self.assertEqual(ErrorCode.GENERAL, result.error_code)
+        self.assertEqual('invalid', result.error_message)
+        self.assertTrue(trial_allowed)
+        self.assertEqual(1, client_mock.get_feature_variation_key.call_count)
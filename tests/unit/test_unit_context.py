@@ -0,0 +1,138 @@
+import unittest
+from dataclasses import FrozenInstanceError
+from unittest.mock import Mock, patch
+
+from kameleoon.data import CustomData
+from kameleoon.exceptions import VisitorCodeInvalid
+from openfeature.evaluation_context import EvaluationContext
+
+from kameleoon_openfeature.context import CompiledContext
+from kameleoon_openfeature.resolver import KameleoonResolver
+from kameleoon_openfeature.types import Data
+
+VISITOR_CODE = 'visitorCode'
+
+
+class TestCompiledContext(unittest.TestCase):
+    def setUp(self):
+        self.attributes = {
+            'variableKey': 'varKey',
+            Data.Type.CUSTOM_DATA: {Data.CustomDataType.INDEX: 1, Data.CustomDataType.VALUES: 'v'}
+        }
+
+    def test_invalid_targeting_key_raises_visitor_code_invalid(self):
+        # assert
+        for targeting_key in (None, '', 'x' * 256, 10):
+            with self.assertRaises(VisitorCodeInvalid):
+                CompiledContext(targeting_key, self.attributes)
+
+    def test_compile_pre_normalizes_context(self):
+        # act
+        compiled = CompiledContext.compile(EvaluationContext(VISITOR_CODE, self.attributes))
+
+        # assert
+        self.assertEqual(VISITOR_CODE, compiled.visitor_code)
+        self.assertEqual('varKey', compiled.variable_key)
+        self.assertEqual(1, len(compiled.kameleoon_data))
+        self.assertIsInstance(compiled.kameleoon_data[0], CustomData)
+        self.assertIs(compiled, CompiledContext.compile(compiled))
+
+    def test_compiled_context_is_frozen_and_detached_from_source(self):
+        # arrange
+        compiled = CompiledContext(VISITOR_CODE, self.attributes)
+        fingerprint = compiled.fingerprint
+
+        # act
+        self.attributes['variableKey'] = 'other'
+
+        # assert
+        self.assertEqual('varKey', compiled.attributes['variableKey'])
+        self.assertEqual(fingerprint, compiled.fingerprint)
+        with self.assertRaises(FrozenInstanceError):
+            compiled.targeting_key = 'other'
+        with self.assertRaises(TypeError):
+            compiled.attributes['variableKey'] = 'other'
+
+    def test_fingerprint_is_stable_and_order_independent(self):
+        # arrange
+        reordered = dict(reversed(list(self.attributes.items())))
+
+        # act
+        first = CompiledContext(VISITOR_CODE, self.attributes)
+        second = CompiledContext(VISITOR_CODE, reordered)
+        third = CompiledContext('otherVisitor', self.attributes)
+
+        # assert
+        self.assertEqual(first.fingerprint, second.fingerprint)
+        self.assertEqual(first, second)
+        self.assertEqual(hash(first), hash(second))
+        self.assertNotEqual(first, third)
+
+    def test_find_returns_compiled_context_carried_through_merge(self):
+        # arrange
+        compiled = CompiledContext(VISITOR_CODE, self.attributes)
+
+        # act
+        merged = EvaluationContext().merge(compiled)
+        extended = EvaluationContext(attributes={'extra': 1}).merge(compiled)
+        retargeted = compiled.merge(EvaluationContext('otherVisitor'))
+
+        # assert
+        self.assertIsNot(compiled, merged)
+        self.assertIs(compiled, CompiledContext.find(merged))
+        self.assertIsNone(CompiledContext.find(extended))
+        self.assertIsNone(CompiledContext.find(retargeted))
+        self.assertIsNone(CompiledContext.find(EvaluationContext(VISITOR_CODE, self.attributes)))
+        self.assertIsNone(CompiledContext.find(None))
+
+    def test_find_ignores_compiled_context_with_overridden_attributes(self):
+        # arrange
+        compiled = CompiledContext(VISITOR_CODE, self.attributes)
+
+        # act
+        overridden_variable_key = compiled.merge(EvaluationContext(attributes={'variableKey': 'otherKey'}))
+        overridden_custom_data = EvaluationContext().merge(compiled).merge(EvaluationContext(attributes={
+            Data.Type.CUSTOM_DATA: {Data.CustomDataType.INDEX: 1, Data.CustomDataType.VALUES: 'v'}
+        }))
+
+        # assert
+        self.assertIsNone(CompiledContext.find(overridden_variable_key))
+        self.assertIsNone(CompiledContext.find(overridden_custom_data))
+
+    def test_resolver_uses_attributes_overriding_compiled_context(self):
+        # arrange
+        client_mock = Mock()
+        client_mock.get_feature_variation_key.return_value = 'on'
+        client_mock.get_feature_variation_variables.return_value = {'k': 1, 'varKey': 10}
+        resolver = KameleoonResolver(client_mock)
+        compiled = CompiledContext(VISITOR_CODE, self.attributes)
+        invocation_context = EvaluationContext(attributes={
+            'variableKey': 'k',
+            Data.Type.CUSTOM_DATA: {Data.CustomDataType.INDEX: 2, Data.CustomDataType.VALUES: 'w'}
+        })
+
+        # act
+        result = resolver.resolve('flagKey', 0, compiled.merge(invocation_context))
+
+        # assert
+        self.assertEqual(1, result.value)
+        custom_data = client_mock.add_data.call_args.args[1]
+        self.assertEqual((2, ('w',)), (custom_data.index, custom_data.values))
+
+    def test_resolver_skips_normalization_for_compiled_context(self):
+        # arrange
+        client_mock = Mock()
+        client_mock.get_feature_variation_key.return_value = 'on'
+        client_mock.get_feature_variation_variables.return_value = {'k': 1, 'varKey': 10}
+        resolver = KameleoonResolver(client_mock)
+        compiled = CompiledContext(VISITOR_CODE, self.attributes)
+
+        # act
+        with patch('kameleoon_openfeature.resolver.DataConverter.to_kameleoon') as to_kameleoon_mock:
+            result = resolver.resolve('flagKey', 0, EvaluationContext().merge(compiled))
+
+        # assert
+        self.assertEqual(10, result.value)
+        self.assertEqual('on', result.variant)
+        to_kameleoon_mock.assert_not_called()
+        client_mock.add_data.assert_called_once_with(VISITOR_CODE, *compiled.kameleoon_data)
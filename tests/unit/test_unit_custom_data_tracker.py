@@ -0,0 +1,216 @@
+import unittest
+from unittest.mock import Mock, patch
+
+from kameleoon.data import Conversion, CustomData
+from kameleoon.exceptions import VisitorCodeInvalid
+from kameleoon.kameleoon_client_config import KameleoonClientConfig
+from openfeature.evaluation_context import EvaluationContext
+
+from kameleoon_openfeature.context import CompiledContext
+from kameleoon_openfeature.custom_data_tracker import CustomDataTracker
+from kameleoon_openfeature.kameleoon_provider import KameleoonProvider
+from kameleoon_openfeature.resolver import KameleoonResolver
+from kameleoon_openfeature.types import Data
+
+
+def make_context(*custom_data, conversion=None):
+    attributes = {Data.Type.CUSTOM_DATA: [{Data.CustomDataType.INDEX: index, Data.CustomDataType.VALUES: values}
+                                          for index, values in custom_data]}
+    if conversion is not None:
+        attributes[Data.Type.CONVERSION] = {Data.ConversionType.GOAL_ID: conversion}
+    return EvaluationContext(targeting_key='visitor', attributes=attributes)
+
+
+def submit(tracker, visitor_code, entries):
+    changed = tracker.select_changed(visitor_code, entries)
+    tracker.mark_submitted(visitor_code, changed)
+    return changed
+
+
+class TestCustomDataTracker(unittest.TestCase):
+    def test_invalid_arguments_raise_value_error(self):
+        # assert
+        with self.assertRaises(ValueError):
+            CustomDataTracker(ttl_seconds=0)
+        with self.assertRaises(ValueError):
+            CustomDataTracker(max_visitors=0)
+
+    def test_only_changed_custom_data_is_selected(self):
+        # arrange
+        tracker = CustomDataTracker()
+        first = {'index': 1, 'values': 'a'}
+        second = {'index': 2, 'values': ['b', 'c']}
+        conversion = Conversion(1)
+
+        # act
+        initial = submit(tracker, 'visitor', [first, second, conversion])
+        repeated = submit(tracker, 'visitor', [{'index': 1, 'values': ['a']}, second, conversion])
+        changed = submit(tracker, 'visitor', [first, {'index': 2, 'values': ['b']}])
+        other_visitor = submit(tracker, 'otherVisitor', [first])
+
+        # assert
+        self.assertEqual([first, second, conversion], initial)
+        self.assertEqual([conversion], repeated)
+        self.assertEqual([{'index': 2, 'values': ['b']}], changed)
+        self.assertEqual([first], other_visitor)
+
+    def test_custom_data_objects_are_tracked(self):
+        # arrange
+        tracker = CustomDataTracker()
+
+        # act
+        initial = submit(tracker, 'visitor', [CustomData(1, 'a'), CustomData('name', 'b')])
+        repeated = submit(tracker, 'visitor', [CustomData(1, 'a'), CustomData('name', 'b')])
+
+        # assert
+        self.assertEqual(2, len(initial))
+        self.assertEqual([], repeated)
+
+    def test_entries_are_selected_until_marked_as_submitted(self):
+        # arrange
+        tracker = CustomDataTracker()
+        entries = [{'index': 1, 'values': 'a'}]
+
+        # act
+        first = tracker.select_changed('visitor', entries)
+        concurrent = tracker.select_changed('visitor', entries)
+        tracker.mark_submitted('visitor', first)
+        after_submission = tracker.select_changed('visitor', entries)
+
+        # assert
+        self.assertEqual(entries, first)
+        self.assertEqual(entries, concurrent)
+        self.assertEqual([], after_submission)
+
+    def test_untrackable_entries_are_always_selected(self):
+        # arrange
+        tracker = CustomDataTracker()
+        entries = ['invalid', {'index': 1, 'values': [['unhashable']]}]
+
+        # act
+        submit(tracker, 'visitor', entries)
+
+        # assert
+        self.assertEqual(entries, submit(tracker, 'visitor', entries))
+
+    def test_state_expires_after_ttl(self):
+        # arrange
+        tracker = CustomDataTracker(ttl_seconds=10.0)
+        entries = [{'index': 1, 'values': 'a'}]
+
+        # act
+        with patch('kameleoon_openfeature.custom_data_tracker.time.monotonic', side_effect=[0.0, 9.0, 20.0]):
+            initial = submit(tracker, 'visitor', entries)
+            within = submit(tracker, 'visitor', entries)
+            expired = submit(tracker, 'visitor', entries)
+
+        # assert
+        self.assertEqual(entries, initial)
+        self.assertEqual([], within)
+        self.assertEqual(entries, expired)
+
+    def test_least_recently_used_visitor_is_evicted(self):
+        # arrange
+        tracker = CustomDataTracker(max_visitors=2)
+        entries = [{'index': 1, 'values': 'a'}]
+        submit(tracker, 'visitor1', entries)
+        submit(tracker, 'visitor2', entries)
+
+        # act
+        submit(tracker, 'visitor1', entries)
+        submit(tracker, 'visitor3', entries)
+
+        # assert
+        self.assertEqual(2, len(tracker))
+        self.assertEqual([], submit(tracker, 'visitor1', entries))
+        self.assertEqual(entries, submit(tracker, 'visitor2', entries))
+        tracker.forget('visitor1')
+        self.assertEqual(entries, submit(tracker, 'visitor1', entries))
+        tracker.clear()
+        self.assertEqual(0, len(tracker))
+
+
+class TestKameleoonResolverCustomDataTracker(unittest.TestCase):
+    def setUp(self):
+        self.client_mock = Mock()
+        self.client_mock.get_feature_variation_key.return_value = 'on'
+        self.client_mock.get_feature_variation_variables.return_value = {'k': 10}
+        self.tracker = CustomDataTracker()
+        self.resolver = KameleoonResolver(self.client_mock, custom_data_tracker=self.tracker)
+
+    def __added_data(self):
+        return [data for call in self.client_mock.add_data.call_args_list for data in call.args[1:]]
+
+    def test_only_changed_custom_data_is_added(self):
+        # act
+        self.resolver.resolve('flagKey', 0, make_context((1, 'a'), (2, 'b')))
+        first_data = self.__added_data()
+        self.client_mock.add_data.reset_mock()
+        self.resolver.resolve('flagKey', 0, make_context((1, 'a'), (2, 'c'), conversion=5))
+        second_data = self.__added_data()
+        self.client_mock.add_data.reset_mock()
+        self.resolver.resolve('flagKey', 0, make_context((1, 'a'), (2, 'c')))
+
+        # assert
+        self.assertEqual([(1, ('a',)), (2, ('b',))], [(data.index, data.values) for data in first_data])
+        self.assertEqual(2, len(second_data))
+        self.assertEqual((2, ('c',)), (second_data[0].index, second_data[0].values))
+        self.assertEqual(5, second_data[1].goal_id)
+        self.client_mock.add_data.assert_not_called()
+
+    def test_compiled_context_data_is_added_once(self):
+        # arrange
+        context = CompiledContext.compile(make_context((1, 'a')))
+
+        # act
+        self.resolver.resolve('flagKey', 0, context)
+        self.resolver.resolve('flagKey', 0, context)
+
+        # assert
+        self.client_mock.add_data.assert_called_once()
+
+    def test_concurrent_evaluation_adds_data_not_yet_added(self):
+        # arrange
+        context = make_context((1, 'a'))
+        events = []
+
+        def add_data(visitor_code, *data):
+            events.append('add_data')
+            if len(events) == 1:
+                self.resolver.resolve('flagKey', 0, context)
+
+        self.client_mock.add_data.side_effect = add_data
+        self.client_mock.get_feature_variation_key.side_effect = lambda *args: events.append('variation') or 'on'
+
+        # act
+        self.resolver.resolve('flagKey', 0, context)
+        self.resolver.resolve('flagKey', 0, context)
+
+        # assert
+        self.assertEqual(['add_data', 'add_data', 'variation', 'variation', 'variation'], events)
+
+    def test_failed_add_data_is_submitted_again(self):
+        # arrange
+        self.client_mock.add_data.side_effect = VisitorCodeInvalid('invalid')
+
+        # act
+        self.resolver.resolve('flagKey', 0, make_context((1, 'a')))
+        self.client_mock.add_data.side_effect = None
+        self.resolver.resolve('flagKey', 0, make_context((1, 'a')))
+
+        # assert
+        self.assertEqual(2, self.client_mock.add_data.call_count)
+
+
+class TestKameleoonProviderCustomDataTracker(unittest.TestCase):
+    def test_tracker_ttl_defaults_to_session_duration(self):
+        # arrange
+        tracker = CustomDataTracker()
+        config = KameleoonClientConfig('clientId', 'clientSecret', session_duration_minute=5)
+
+        # act
+        provider = KameleoonProvider('trackerSiteCode', config=config, custom_data_tracker=tracker)
+        provider.shutdown()
+
+        # assert
+        self.assertEqual(300, tracker.ttl_seconds)
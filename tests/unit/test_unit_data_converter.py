@@ -111,3 +111,26 @@ class TestDataConverter(unittest.TestCase):
         self.assertEqual(conversions[1].goal_id, goal_id2)
         self.assertEqual(custom_data[0].id, index1)
         self.assertEqual(custom_data[1].id, index2)
+
+    def test_to_kameleoon_with_custom_data_filter_converts_selected_custom_data(self):
+        # arrange
+        context_data = {
+            Data.Type.CONVERSION: {Data.ConversionType.GOAL_ID: 1},
+            Data.Type.CUSTOM_DATA: [
+                {Data.CustomDataType.INDEX: 1},
+                {Data.CustomDataType.INDEX: 2}
+            ]
+        }
+
+        eval_context = EvaluationContext(attributes=context_data)
+
+        # act
+        result = DataConverter.to_kameleoon(eval_context, lambda values: values[1:])
+
+        conversions = [item for item in result if isinstance(item, Conversion)]
+        custom_data = [item for item in result if isinstance(item, CustomData)]
+
+        # assert
+        self.assertEqual(len(result), 2)
+        self.assertEqual(conversions[0].goal_id, 1)
+        self.assertEqual(custom_data[0].id, 2)
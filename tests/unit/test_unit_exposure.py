@@ -0,0 +1,103 @@
+import unittest
+from unittest.mock import Mock, patch
+
+from kameleoon.kameleoon_client_config import KameleoonClientConfig
+from openfeature.evaluation_context import EvaluationContext
+
+from kameleoon_openfeature.exposure import ExposureDeduplicator
+from kameleoon_openfeature.kameleoon_provider import KameleoonProvider
+from kameleoon_openfeature.resolver import KameleoonResolver
+
+
+class TestExposureDeduplicator(unittest.TestCase):
+    def test_invalid_arguments_raise_value_error(self):
+        # assert
+        with self.assertRaises(ValueError):
+            ExposureDeduplicator(window_seconds=0)
+        with self.assertRaises(ValueError):
+            ExposureDeduplicator(max_visitors=0)
+
+    def test_tracked_variant_is_returned_within_window(self):
+        # arrange
+        deduplicator = ExposureDeduplicator(window_seconds=10.0)
+
+        # act
+        with patch('kameleoon_openfeature.exposure.time.monotonic', side_effect=[0.0, 1.0, 9.0, 11.0]):
+            before = deduplicator.get_tracked_variant('visitor', 'flag')
+            deduplicator.mark_tracked('visitor', 'flag', 'on')
+            within = deduplicator.get_tracked_variant('visitor', 'flag')
+            expired = deduplicator.get_tracked_variant('visitor', 'flag')
+
+        # assert
+        self.assertIsNone(before)
+        self.assertEqual('on', within)
+        self.assertIsNone(expired)
+        self.assertIsNone(deduplicator.get_tracked_variant('visitor', 'otherFlag'))
+
+    def test_least_recently_used_visitor_is_evicted(self):
+        # arrange
+        deduplicator = ExposureDeduplicator(max_visitors=2)
+        deduplicator.mark_tracked('visitor1', 'flag', 'on')
+        deduplicator.mark_tracked('visitor2', 'flag', 'on')
+
+        # act
+        deduplicator.get_tracked_variant('visitor1', 'flag')
+        deduplicator.mark_tracked('visitor3', 'flag', 'on')
+
+        # assert
+        self.assertEqual(2, len(deduplicator))
+        self.assertEqual('on', deduplicator.get_tracked_variant('visitor1', 'flag'))
+        self.assertIsNone(deduplicator.get_tracked_variant('visitor2', 'flag'))
+        deduplicator.clear()
+        self.assertEqual(0, len(deduplicator))
+
+
+class TestKameleoonResolverExposure(unittest.TestCase):
+    def setUp(self):
+        self.client_mock = Mock()
+        self.client_mock.get_feature_variation_key.return_value = 'on'
+        self.client_mock.get_variation.return_value = Mock(key='on')
+        self.client_mock.get_feature_variation_variables.return_value = {'k': 10}
+        self.resolver = KameleoonResolver(self.client_mock, deduplicator=ExposureDeduplicator())
+        self.context = EvaluationContext(targeting_key='visitor')
+
+    def test_repeated_evaluations_track_exposure_once(self):
+        # act
+        results = [self.resolver.resolve('flagKey', 0, self.context) for _ in range(3)]
+
+        # assert
+        self.assertEqual([10, 10, 10], [result.value for result in results])
+        self.client_mock.get_feature_variation_key.assert_called_once_with('visitor', 'flagKey')
+        self.assertEqual(2, self.client_mock.get_variation.call_count)
+        self.client_mock.get_variation.assert_called_with('visitor', 'flagKey', track=False)
+
+    def test_changed_variant_is_tracked_again(self):
+        # arrange
+        self.resolver.resolve('flagKey', 0, self.context)
+        self.client_mock.get_variation.return_value = Mock(key='off')
+        self.client_mock.get_feature_variation_key.return_value = 'off'
+
+        # act
+        result = self.resolver.resolve('flagKey', 0, self.context)
+
+        # assert
+        self.assertEqual('off', result.variant)
+        self.assertEqual(2, self.client_mock.get_feature_variation_key.call_count)
+
+
+class TestKameleoonProviderExposure(unittest.TestCase):
+    def test_window_defaults_to_session_duration(self):
+        # arrange
+        deduplicator = ExposureDeduplicator()
+        explicit_deduplicator = ExposureDeduplicator(window_seconds=60.0)
+        config = KameleoonClientConfig('clientId', 'clientSecret', session_duration_minute=5)
+
+        # act
+        for index, exposure_deduplicator in enumerate((deduplicator, explicit_deduplicator)):
+            provider = KameleoonProvider(f'exposureSiteCode{index}', config=config,
+                                         exposure_deduplicator=exposure_deduplicator)
+            provider.shutdown()
+
+        # assert
+        self.assertEqual(300, deduplicator.window_seconds)
+        self.assertEqual(60.0, explicit_deduplicator.window_seconds)
@@ -5,6 +5,7 @@ from kameleoon import KameleoonClientFactory
 from openfeature.exception import ProviderNotReadyError
 from openfeature.flag_evaluation import FlagResolutionDetails, Reason
 
+from kameleoon_openfeature.circuit_breaker import CircuitBreaker
 from kameleoon_openfeature.kameleoon_provider import KameleoonProvider
 from kameleoon.kameleoon_client_config import KameleoonClientConfig
 
@@ -117,6 +118,40 @@ class TestKameleoonProvider(unittest.TestCase):
         self.assertIs(client_to_check, client_first)
         self.assertIsNot(client_first, client_second)
 
+    def test_shutdown_of_swapped_provider_keeps_new_client(self):
+        # arrange
+        site_code = 'swapSiteCode'
+        config = KameleoonClientConfig('clientId', 'clientSecret')
+        old_provider = KameleoonProvider(site_code, config=config)
+        old_client = old_provider.get_client()
+        KameleoonClientFactory.forget(site_code)
+        new_provider = KameleoonProvider(site_code, config=config)
+        self.addCleanup(new_provider.shutdown)
+
+        # act
+        old_provider.shutdown()
+        client = KameleoonClientFactory.create(site_code, config=config)
+
+        # assert
+        self.assertIsNot(old_client, client)
+        self.assertIs(new_provider.get_client(), client)
+
+    def test_circuit_breaker_without_probe_probes_client(self):
+        # arrange
+        config = KameleoonClientConfig('clientId', 'clientSecret')
+        breaker = CircuitBreaker()
+
+        # act
+        provider = KameleoonProvider('circuitSiteCode', config=config, circuit_breaker=breaker)
+        self.addCleanup(provider.shutdown)
+
+        # assert
+        self.assertIsNotNone(breaker.probe)
+        with patch.object(provider.get_client(), 'get_feature_list', return_value=['flagKey']):
+            self.assertTrue(breaker.probe())
+        with patch.object(provider.get_client(), 'get_feature_list', return_value=[]):
+            self.assertFalse(breaker.probe())
+
     def setup_mock_resolver(self, expected_value):
         result = FlagResolutionDetails(
             value=expected_value,
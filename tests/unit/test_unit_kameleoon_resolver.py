@@ -95,6 +95,7 @@ class TestKameleoonResolver(unittest.TestCase):
         exception = FeatureNotFound('featureException')
         self.client_mock.add_data.return_value = None
         self.client_mock.get_feature_variation_key.side_effect = exception
+        self.client_mock.get_feature_list.return_value = ['otherFlag']
 
         eval_context = EvaluationContext(targeting_key=visitor_code)
         expected_error_code = ErrorCode.FLAG_NOT_FOUND
@@ -0,0 +1,219 @@
+import threading
+import unittest
+from unittest.mock import Mock, patch
+
+from kameleoon.kameleoon_client_config import KameleoonClientConfig
+from openfeature.evaluation_context import EvaluationContext
+from openfeature.exception import ErrorCode
+from openfeature.flag_evaluation import Reason
+
+from kameleoon_openfeature.circuit_breaker import CircuitBreaker
+from kameleoon_openfeature.kameleoon_provider import KameleoonProvider
+from kameleoon_openfeature.last_known_good import LastKnownGoodStore
+from kameleoon_openfeature.resolver import KameleoonResolver
+
+VISITOR_CODE = 'visitor'
+
+
+def capture_threads(threads):
+    thread_class = threading.Thread
+
+    def make_thread(*args, **kwargs):
+        thread = thread_class(*args, **kwargs)
+        threads.append(thread)
+        return thread
+
+    return patch('kameleoon_openfeature.kameleoon_provider.threading.Thread', side_effect=make_thread)
+
+
+class TestLastKnownGoodStore(unittest.TestCase):
+    def test_invalid_arguments_raise_value_error(self):
+        # assert
+        with self.assertRaises(ValueError):
+            LastKnownGoodStore(max_entries=0)
+
+    def test_saved_result_is_returned(self):
+        # arrange
+        store = LastKnownGoodStore()
+
+        # act
+        store.save(VISITOR_CODE, 'flag', 'on', {'k': 1})
+        store.save('otherVisitor', 'flag', 'on', {'k': 2})
+
+        # assert
+        self.assertEqual(('on', {'k': 2}), store.get(VISITOR_CODE, 'flag'))
+        self.assertIsNone(store.get(VISITOR_CODE, 'otherFlag'))
+        self.assertEqual(2, len(store))
+        store.clear()
+        self.assertIsNone(store.get(VISITOR_CODE, 'flag'))
+
+    def test_least_recently_saved_entry_is_evicted(self):
+        # arrange
+        store = LastKnownGoodStore(max_entries=2)
+
+        # act
+        for visitor_code in ('visitor1', 'visitor2', 'visitor3'):
+            store.save(visitor_code, 'flag', 'on', {'k': 1})
+
+        # assert
+        self.assertEqual(2, len(store))
+        self.assertIsNone(store.get('visitor1', 'flag'))
+        self.assertIsNotNone(store.get('visitor3', 'flag'))
+
+
+class TestKameleoonResolverLastKnownGood(unittest.TestCase):
+    def setUp(self):
+        self.client_mock = Mock()
+        self.client_mock.get_feature_variation_key.return_value = 'on'
+        self.client_mock.get_feature_variation_variables.return_value = {'k': 10}
+        self.store = LastKnownGoodStore()
+        self.context = EvaluationContext(targeting_key=VISITOR_CODE)
+
+    def test_stale_result_is_served_on_sdk_failure(self):
+        # arrange
+        resolver = KameleoonResolver(self.client_mock, last_known_good=self.store)
+        resolver.resolve('flagKey', 0, self.context)
+        self.client_mock.get_feature_variation_key.side_effect = RuntimeError('degraded')
+
+        # act
+        result = resolver.resolve('flagKey', 0, self.context)
+        unknown_result = resolver.resolve('otherFlag', 0, self.context)
+
+        # assert
+        self.assertEqual(10, result.value)
+        self.assertEqual('on', result.variant)
+        self.assertEqual(Reason.STALE, result.reason)
+        self.assertIsNone(result.error_code)
+        self.assertEqual(0, unknown_result.value)
+        self.assertEqual(ErrorCode.GENERAL, unknown_result.error_code)
+
+    def test_stale_result_is_served_while_client_is_unavailable(self):
+        for make_unavailable in (lambda resolver: setattr(resolver, 'client', None),
+                                 lambda resolver: setattr(resolver, 'ready', False)):
+            # arrange
+            resolver = KameleoonResolver(self.client_mock, last_known_good=self.store)
+            resolver.resolve('flagKey', 0, self.context)
+            make_unavailable(resolver)
+
+            # act
+            result = resolver.resolve('flagKey', 0, self.context)
+            unknown_result = resolver.resolve('flagKey', 0, EvaluationContext(targeting_key='otherVisitor'))
+
+            # assert
+            self.assertEqual(10, result.value)
+            self.assertEqual(Reason.STALE, result.reason)
+            self.assertEqual(ErrorCode.PROVIDER_NOT_READY, unknown_result.error_code)
+
+    def test_stale_result_is_served_while_circuit_is_open(self):
+        # arrange
+        breaker = CircuitBreaker(failure_threshold=1, recovery_timeout_seconds=60.0)
+        resolver = KameleoonResolver(self.client_mock, circuit_breaker=breaker, last_known_good=self.store)
+        resolver.resolve('flagKey', 0, self.context)
+        breaker.record_failure()
+
+        # act
+        result = resolver.resolve('flagKey', 0, self.context)
+
+        # assert
+        self.assertEqual(10, result.value)
+        self.assertEqual(Reason.STALE, result.reason)
+        self.assertEqual(1, self.client_mock.get_feature_variation_key.call_count)
+
+
+class TestKameleoonProviderLastKnownGood(unittest.TestCase):
+    def setUp(self):
+        self.store = LastKnownGoodStore()
+        self.provider = KameleoonProvider('lkgSiteCode', config=KameleoonClientConfig('clientId', 'clientSecret'),
+                                          last_known_good=self.store)
+        self.addCleanup(self.provider.shutdown)
+        self.context = EvaluationContext(targeting_key=VISITOR_CODE)
+
+    def test_initialize_waits_for_client_when_store_is_empty(self):
+        # arrange
+        with patch.object(self.provider.get_client(), 'wait_init', return_value=True) as wait_init_mock:
+            # act
+            self.provider.initialize(self.context)
+
+        # assert
+        wait_init_mock.assert_called_once()
+
+    def test_initialize_serves_stale_results_until_client_is_ready(self):
+        # arrange
+        self.store.save(VISITOR_CODE, 'flagKey', 'on', {'k': 10})
+        initialized = threading.Event()
+        client = self.provider.get_client()
+
+        # act
+        with patch.object(client, 'wait_init', side_effect=lambda: initialized.wait(1.0)), \
+                patch.object(client, 'get_feature_variation_key', return_value='off'), \
+                patch.object(client, 'get_feature_variation_variables', return_value={'k': 20}):
+            self.provider.initialize(self.context)
+            stale_result = self.provider.resolve_integer_details('flagKey', 0, self.context)
+            initialized.set()
+            for _ in range(100):
+                live_result = self.provider.resolve_integer_details('flagKey', 0, self.context)
+                if live_result.reason != Reason.STALE:
+                    break
+                threading.Event().wait(0.01)
+
+        # assert
+        self.assertEqual(10, stale_result.value)
+        self.assertEqual(Reason.STALE, stale_result.reason)
+        self.assertEqual(20, live_result.value)
+        self.assertEqual(Reason.STATIC, live_result.reason)
+
+    def test_initialize_recovers_after_failed_first_fetch(self):
+        # arrange
+        self.store.save(VISITOR_CODE, 'flagKey', 'on', {'k': 10})
+        client = self.provider.get_client()
+        initialization_threads = []
+
+        # act
+        with patch.object(KameleoonProvider, 'INITIALIZATION_RETRY_INTERVAL_SECONDS', 0.0), \
+                capture_threads(initialization_threads), \
+                patch.object(client, 'wait_init', side_effect=[False, RuntimeError('timeout'), True]), \
+                patch.object(client, 'get_feature_variation_key', return_value='off'), \
+                patch.object(client, 'get_feature_variation_variables', return_value={'k': 20}), \
+                patch.object(self.provider, 'emit_provider_error') as emit_provider_error_mock, \
+                patch.object(self.provider, 'emit_provider_ready') as emit_provider_ready_mock:
+            self.provider.initialize(self.context)
+            initialization_threads[0].join(1.0)
+            result = self.provider.resolve_integer_details('flagKey', 0, self.context)
+            new_visitor_result = self.provider.resolve_integer_details(
+                'flagKey', 0, EvaluationContext(targeting_key='newVisitor'))
+
+        # assert
+        self.assertEqual(20, result.value)
+        self.assertEqual(Reason.STATIC, result.reason)
+        self.assertEqual(20, new_visitor_result.value)
+        self.assertIsNone(new_visitor_result.error_code)
+        emit_provider_error_mock.assert_called_once()
+        emit_provider_ready_mock.assert_called_once()
+
+    def test_shutdown_stops_waiting_for_failed_initialization(self):
+        # arrange
+        self.store.save(VISITOR_CODE, 'flagKey', 'on', {'k': 10})
+        initialization_threads = []
+
+        # act
+        with capture_threads(initialization_threads), \
+                patch.object(self.provider.get_client(), 'wait_init', return_value=False), \
+                patch.object(self.provider, 'emit_provider_error'):
+            self.provider.initialize(self.context)
+            self.provider.shutdown()
+            initialization_threads[0].join(1.0)
+
+        # assert
+        self.assertFalse(initialization_threads[0].is_alive())
+
+    def test_shutdown_serves_stale_results(self):
+        # arrange
+        self.store.save(VISITOR_CODE, 'flagKey', 'on', {'k': 10})
+
+        # act
+        self.provider.shutdown()
+        result = self.provider.resolve_integer_details('flagKey', 0, self.context)
+
+        # assert
+        self.assertEqual(10, result.value)
+        self.assertEqual(Reason.STALE, result.reason)
@@ -0,0 +1,169 @@
+import unittest
+from dataclasses import FrozenInstanceError
+from unittest.mock import Mock
+
+from openfeature.evaluation_context import EvaluationContext
+from openfeature.exception import ErrorCode
+from openfeature.flag_evaluation import FlagResolutionDetails, Reason
+
+from kameleoon_openfeature.resolution_cache import ResolutionDetailsCache
+from kameleoon_openfeature.resolver import KameleoonResolver
+
+
+class TestResolutionDetailsCache(unittest.TestCase):
+    def test_invalid_arguments_raise_value_error(self):
+        # assert
+        with self.assertRaises(ValueError):
+            ResolutionDetailsCache(max_entries=-1)
+        with self.assertRaises(ValueError):
+            ResolutionDetailsCache(max_error_entries=-1)
+
+    def test_identical_success_result_is_reused(self):
+        # arrange
+        cache = ResolutionDetailsCache()
+
+        # act
+        result = cache.get_success('flag', 'on', 'k', 10)
+        same_result = cache.get_success('flag', 'on', 'k', 10)
+        changed_result = cache.get_success('flag', 'on', 'k', 20)
+        other_type_result = cache.get_success('flag', 'on', 'k', 10.0)
+
+        # assert
+        self.assertIs(result, same_result)
+        self.assertEqual(10, result.value)
+        self.assertEqual('on', result.variant)
+        self.assertEqual(Reason.STATIC, result.reason)
+        self.assertIsNot(result, changed_result)
+        self.assertEqual(20, changed_result.value)
+        self.assertIsInstance(other_type_result.value, float)
+        self.assertIs(changed_result, cache.get_success('flag', 'on', 'k', 20))
+
+    def test_identical_error_result_is_reused(self):
+        # arrange
+        cache = ResolutionDetailsCache()
+
+        # act
+        result = cache.get_error(0, ErrorCode.FLAG_NOT_FOUND, 'message')
+        same_result = cache.get_error(0, ErrorCode.FLAG_NOT_FOUND, 'message')
+        other_result = cache.get_error(0, ErrorCode.GENERAL, 'message')
+
+        # assert
+        self.assertIs(result, same_result)
+        self.assertEqual(0, result.value)
+        self.assertEqual(ErrorCode.FLAG_NOT_FOUND, result.error_code)
+        self.assertEqual(Reason.ERROR, result.reason)
+        self.assertIsNot(result, other_result)
+
+    def test_cached_result_is_immutable(self):
+        # arrange
+        result = ResolutionDetailsCache().get_success('flag', 'on', None, 'on')
+
+        # assert
+        with self.assertRaises(FrozenInstanceError):
+            result.value = 'off'
+        with self.assertRaises(TypeError):
+            result.flag_metadata['key'] = 'value'
+
+    def test_cached_result_equals_mutable_result_with_same_fields(self):
+        # arrange
+        cache = ResolutionDetailsCache()
+
+        # act
+        result = cache.get_success('flag', 'on', 'k', 10)
+        error_result = cache.get_error(0, ErrorCode.GENERAL, 'message', 'on')
+
+        # assert
+        expected = FlagResolutionDetails(value=10, reason=Reason.STATIC, variant='on')
+        self.assertEqual(expected, result)
+        self.assertEqual(result, expected)
+        self.assertNotEqual(FlagResolutionDetails(value=11, reason=Reason.STATIC, variant='on'), result)
+        self.assertEqual(FlagResolutionDetails(value=0, error_code=ErrorCode.GENERAL, error_message='message',
+                                               reason=Reason.ERROR, variant='on'), error_result)
+        self.assertNotEqual(result, 10)
+        self.assertEqual(hash(result), hash(cache.get_success('flag', 'on', 'k', 10)))
+
+    def test_non_scalar_values_are_not_cached(self):
+        # arrange
+        cache = ResolutionDetailsCache()
+
+        # act
+        result = cache.get_success('flag', 'on', 'k', {'a': 1})
+        other_result = cache.get_success('flag', 'on', 'k', {'a': 1})
+
+        # assert
+        self.assertIsNot(result, other_result)
+        self.assertEqual(0, len(cache))
+
+    def test_zero_max_entries_disables_caching(self):
+        # arrange
+        cache = ResolutionDetailsCache(max_entries=0)
+
+        # act
+        result = cache.get_success('flag', 'on', 'k', 10)
+
+        # assert
+        self.assertIsNot(result, cache.get_success('flag', 'on', 'k', 10))
+        self.assertEqual(0, len(cache))
+
+    def test_least_recently_used_result_is_evicted(self):
+        # arrange
+        cache = ResolutionDetailsCache(max_entries=2)
+        result1 = cache.get_success('flag1', 'on', 'k', 10)
+        result2 = cache.get_success('flag2', 'on', 'k', 10)
+
+        # act
+        cache.get_success('flag1', 'on', 'k', 10)
+        cache.get_success('flag3', 'on', 'k', 10)
+
+        # assert
+        self.assertEqual(2, len(cache))
+        self.assertIs(result1, cache.get_success('flag1', 'on', 'k', 10))
+        self.assertIsNot(result2, cache.get_success('flag2', 'on', 'k', 10))
+
+    def test_errors_do_not_evict_successful_results(self):
+        # arrange
+        cache = ResolutionDetailsCache(max_entries=1, max_error_entries=1)
+        result = cache.get_success('flag', 'on', 'k', 10)
+
+        # act
+        for index in range(10):
+            cache.get_error(0, ErrorCode.GENERAL, f'message {index}')
+
+        # assert
+        self.assertIs(result, cache.get_success('flag', 'on', 'k', 10))
+        self.assertEqual(2, len(cache))
+
+    def test_long_error_messages_are_not_cached(self):
+        # arrange
+        cache = ResolutionDetailsCache()
+        message = 'm' * (ResolutionDetailsCache.MAX_ERROR_MESSAGE_LENGTH + 1)
+
+        # act
+        result = cache.get_error(0, ErrorCode.GENERAL, message)
+
+        # assert
+        self.assertEqual(message, result.error_message)
+        self.assertIsNot(result, cache.get_error(0, ErrorCode.GENERAL, message))
+        self.assertEqual(0, len(cache))
+
+
+class TestKameleoonResolverResolutionCache(unittest.TestCase):
+    def test_resolver_reuses_results(self):
+        # arrange
+        client_mock = Mock()
+        client_mock.get_feature_variation_key.return_value = 'on'
+        client_mock.get_feature_variation_variables.return_value = {'k': 10}
+        resolver = KameleoonResolver(client_mock)
+        context = EvaluationContext(targeting_key='visitor', attributes={'variableKey': 'k'})
+
+        # act
+        result = resolver.resolve('flagKey', 0, context)
+        same_result = resolver.resolve('flagKey', 0, context)
+        error_result = resolver.resolve('flagKey', 0, EvaluationContext())
+        same_error_result = resolver.resolve('flagKey', 0, EvaluationContext())
+
+        # assert
+        self.assertEqual(10, result.value)
+        self.assertIs(result, same_result)
+        self.assertEqual(ErrorCode.TARGETING_KEY_MISSING, error_result.error_code)
+        self.assertIs(error_result, same_error_result)
@@ -0,0 +1,142 @@
+import unittest
+from unittest.mock import Mock, patch
+
+from openfeature.evaluation_context import EvaluationContext
+from openfeature.exception import ErrorCode
+from openfeature.flag_evaluation import FlagResolutionDetails, Reason
+
+from kameleoon_openfeature.context import CompiledContext
+from kameleoon_openfeature.resolver import KameleoonResolver
+from kameleoon_openfeature.tracing import EvaluationTracer
+
+
+class TestEvaluationTracer(unittest.TestCase):
+    def test_invalid_arguments_raise_value_error(self):
+        # assert
+        with self.assertRaises(ValueError):
+            EvaluationTracer(sample_rate=1.5)
+        with self.assertRaises(ValueError):
+            EvaluationTracer(capacity=0)
+
+    def test_not_sampled_fast_evaluation_is_not_captured(self):
+        # arrange
+        tracer = EvaluationTracer(sample_rate=0.0, slow_threshold_ms=1000.0)
+
+        # act
+        trace = tracer.begin('flagKey')
+        tracer.end(trace, FlagResolutionDetails(value=1, reason=Reason.STATIC, variant='on'))
+
+        # assert
+        self.assertEqual([], tracer.get_traces())
+
+    def test_evaluation_is_not_traced_without_sampling_and_slow_threshold(self):
+        # arrange
+        tracer = EvaluationTracer(sample_rate=0.0)
+
+        # act
+        with patch('kameleoon_openfeature.tracing.EvaluationTrace') as trace_mock:
+            trace = tracer.begin('flagKey')
+
+        # assert
+        self.assertIsNone(trace)
+        trace_mock.assert_not_called()
+
+    def test_resolver_skips_untraced_evaluation(self):
+        # arrange
+        client_mock = Mock()
+        client_mock.get_feature_variation_key.return_value = 'on'
+        client_mock.get_feature_variation_variables.return_value = {'k': 10}
+        tracer = EvaluationTracer(sample_rate=0.0)
+        resolver = KameleoonResolver(client_mock, tracer)
+
+        # act
+        result = resolver.resolve('flagKey', 0, EvaluationContext(targeting_key='visitor'))
+
+        # assert
+        self.assertEqual(10, result.value)
+        self.assertEqual([], tracer.get_traces())
+
+    def test_sampled_evaluation_is_captured(self):
+        # arrange
+        tracer = EvaluationTracer(sample_rate=1.0)
+
+        # act
+        trace = tracer.begin('flagKey')
+        trace.mark('stage')
+        tracer.end(trace, FlagResolutionDetails(value=1, reason=Reason.ERROR, variant='on',
+                                                error_code=ErrorCode.TYPE_MISMATCH))
+
+        # assert
+        traces = tracer.get_traces()
+        self.assertEqual(1, len(traces))
+        self.assertEqual('flagKey', traces[0].flag_key)
+        self.assertEqual('on', traces[0].variant)
+        self.assertEqual(Reason.ERROR, traces[0].reason)
+        self.assertEqual(ErrorCode.TYPE_MISMATCH, traces[0].error_code)
+        self.assertIn('stage', traces[0].stages)
+        self.assertTrue(traces[0].sampled)
+        self.assertFalse(traces[0].slow)
+
+    def test_slow_evaluation_is_always_captured(self):
+        # arrange
+        tracer = EvaluationTracer(sample_rate=0.0, slow_threshold_ms=5.0)
+
+        # act
+        with patch('kameleoon_openfeature.tracing.time.perf_counter', side_effect=[0.0, 0.01]):
+            trace = tracer.begin('flagKey')
+            tracer.end(trace, FlagResolutionDetails(value=1, reason=Reason.STATIC))
+
+        # assert
+        traces = tracer.get_traces()
+        self.assertEqual(1, len(traces))
+        self.assertTrue(traces[0].slow)
+        self.assertFalse(traces[0].sampled)
+        self.assertAlmostEqual(10.0, traces[0].duration_ms)
+
+    def test_ring_buffer_drops_oldest_traces(self):
+        # arrange
+        tracer = EvaluationTracer(sample_rate=1.0, capacity=2)
+
+        # act
+        for flag_key in ('flag1', 'flag2', 'flag3'):
+            tracer.end(tracer.begin(flag_key), FlagResolutionDetails(value=1))
+
+        # assert
+        self.assertEqual(['flag2', 'flag3'], [trace.flag_key for trace in tracer.get_traces()])
+        tracer.clear()
+        self.assertEqual([], tracer.get_traces())
+
+    def test_resolver_records_stage_timings(self):
+        # arrange
+        client_mock = Mock()
+        client_mock.get_feature_variation_key.return_value = 'on'
+        client_mock.get_feature_variation_variables.return_value = {'k': 10}
+        tracer = EvaluationTracer(sample_rate=1.0)
+        resolver = KameleoonResolver(client_mock, tracer)
+
+        # act
+        result = resolver.resolve('flagKey', 0, EvaluationContext(targeting_key='visitor'))
+
+        # assert
+        self.assertEqual(10, result.value)
+        traces = tracer.get_traces()
+        self.assertEqual(1, len(traces))
+        self.assertEqual('on', traces[0].variant)
+        self.assertEqual('visitor', traces[0].targeting_key)
+        self.assertIsNone(traces[0].fingerprint)
+        self.assertEqual(['to_kameleoon', 'add_data', 'get_feature_variation_key', 'get_feature_variation_variables'],
+                         list(traces[0].stages))
+
+    def test_trace_identifies_compiled_context(self):
+        # arrange
+        tracer = EvaluationTracer(sample_rate=1.0)
+        context = CompiledContext('visitor', {'variableKey': 'k'})
+
+        # act
+        tracer.end(tracer.begin('flagKey', context), FlagResolutionDetails(value=1))
+
+        # assert
+        trace = tracer.get_traces()[0]
+        self.assertEqual('visitor', trace.targeting_key)
+        self.assertEqual(context.fingerprint, trace.fingerprint)
+        self.assertIn(context.fingerprint, repr(trace))
@@ -0,0 +1,168 @@
+import unittest
+from unittest.mock import Mock, call, patch
+
+from kameleoon.exceptions import FeatureNotFound, FeatureVariationNotFound
+from kameleoon.kameleoon_client_config import KameleoonClientConfig
+from openfeature.evaluation_context import EvaluationContext
+
+from kameleoon_openfeature.kameleoon_provider import KameleoonProvider
+from kameleoon_openfeature.resolution_cache import ResolutionDetailsCache
+from kameleoon_openfeature.resolver import KameleoonResolver
+
+VARIABLES = {
+    ('flag1', 'off'): {'k': 1, 'json': {'a': 1}},
+    ('flag1', 'on'): {'k': 2},
+    ('flag2', 'on'): {'enabled': True},
+}
+
+
+def get_feature_variation_variables(flag_key, variant):
+    if (flag_key, variant) not in VARIABLES:
+        raise FeatureVariationNotFound(variant)
+    return VARIABLES[(flag_key, variant)]
+
+
+def make_data_file():
+    return Mock(feature_flags={
+        'flag1': Mock(variations={'off': Mock(), 'on': Mock()}),
+        'flag2': Mock(variations={'on': Mock(), 'broken': Mock()}),
+    })
+
+
+class TestKameleoonResolverWarmUp(unittest.TestCase):
+    def setUp(self):
+        self.client_mock = Mock()
+        self.client_mock.get_data_file.return_value = make_data_file()
+        self.client_mock.get_feature_variation_variables.side_effect = get_feature_variation_variables
+
+    def test_warm_up_caches_results_of_all_variations(self):
+        # arrange
+        resolver = KameleoonResolver(self.client_mock)
+
+        # act
+        report = resolver.warm_up()
+
+        # assert
+        self.assertEqual(2, report.flags)
+        self.assertEqual(2, report.evaluated_flags)
+        self.assertEqual(4, report.variants)
+        self.assertEqual(3, report.cached_results)
+        self.assertEqual(1, report.failures)
+        self.assertGreaterEqual(report.duration_ms, 0.0)
+        self.assertEqual(3, len(resolver.resolution_cache))
+        self.client_mock.get_variation.assert_has_calls([
+            call(KameleoonResolver.WARM_UP_VISITOR_CODE, 'flag1', track=False),
+            call(KameleoonResolver.WARM_UP_VISITOR_CODE, 'flag2', track=False),
+        ])
+
+    def test_failed_variation_assignment_is_counted(self):
+        # arrange
+        self.client_mock.get_variation.side_effect = [FeatureNotFound('flag1'), Mock()]
+        resolver = KameleoonResolver(self.client_mock)
+
+        # act
+        report = resolver.warm_up()
+
+        # assert
+        self.assertEqual(1, report.evaluated_flags)
+        self.assertEqual(2, report.failures)
+        self.assertEqual(3, report.cached_results)
+
+    def test_evaluation_reuses_warmed_up_result(self):
+        # arrange
+        cache = ResolutionDetailsCache()
+        resolver = KameleoonResolver(self.client_mock, resolution_cache=cache)
+        resolver.warm_up()
+        warmed_up = cache.get_success('flag1', 'on', 'k', 2)
+        self.client_mock.get_feature_variation_key.return_value = 'on'
+
+        # act
+        result = resolver.resolve('flag1', 0, EvaluationContext(targeting_key='visitor'))
+
+        # assert
+        self.assertIs(warmed_up, result)
+
+    def test_warm_up_leaves_room_in_cache(self):
+        # arrange
+        resolver = KameleoonResolver(self.client_mock, resolution_cache=ResolutionDetailsCache(max_entries=3))
+
+        # act
+        report = resolver.warm_up()
+
+        # assert
+        self.assertEqual(2, report.cached_results)
+        self.assertEqual(2, len(resolver.resolution_cache))
+
+    def test_evaluations_after_full_warm_up_keep_warmed_up_results(self):
+        # arrange
+        cache = ResolutionDetailsCache(max_entries=4, max_error_entries=1)
+        resolver = KameleoonResolver(self.client_mock, resolution_cache=cache)
+        report = resolver.warm_up()
+        warmed_up = [cache.get_success('flag1', 'off', 'k', 1), cache.get_success('flag1', 'on', 'k', 2),
+                     cache.get_success('flag2', 'on', 'enabled', True)]
+        self.client_mock.get_feature_variation_key.return_value = 'new'
+        self.client_mock.get_feature_variation_variables.side_effect = None
+        self.client_mock.get_feature_variation_variables.return_value = {'k': 3}
+
+        # act
+        resolver.resolve('flag3', 0, EvaluationContext(targeting_key='visitor'))
+        resolver.resolve('flag3', 0, EvaluationContext())
+
+        # assert
+        self.assertEqual(3, report.cached_results)
+        self.assertIs(warmed_up[0], cache.get_success('flag1', 'off', 'k', 1))
+        self.assertIs(warmed_up[1], cache.get_success('flag1', 'on', 'k', 2))
+        self.assertIs(warmed_up[2], cache.get_success('flag2', 'on', 'enabled', True))
+
+
+class TestKameleoonProviderWarmUp(unittest.TestCase):
+    def make_provider(self, warm_up):
+        provider = KameleoonProvider('warmUpSiteCode', config=KameleoonClientConfig('clientId', 'clientSecret'),
+                                     warm_up=warm_up)
+        self.addCleanup(provider.shutdown)
+        return provider
+
+    def test_initialize_warms_up_when_enabled(self):
+        # arrange
+        provider = self.make_provider(warm_up=True)
+        client = provider.get_client()
+
+        # act
+        with patch.object(client, 'wait_init', return_value=True), \
+                patch.object(client, 'get_data_file', return_value=make_data_file()), \
+                patch.object(client, 'get_feature_variation_variables', side_effect=get_feature_variation_variables):
+            provider.initialize(EvaluationContext())
+
+        # assert
+        report = provider.get_warm_up_report()
+        self.assertIsNotNone(report)
+        self.assertEqual(2, report.flags)
+        self.assertEqual(3, report.cached_results)
+        self.assertIsNone(report.error)
+
+    def test_initialize_does_not_warm_up_by_default(self):
+        # arrange
+        provider = self.make_provider(warm_up=False)
+        client = provider.get_client()
+
+        # act
+        with patch.object(client, 'wait_init', return_value=True), \
+                patch.object(client, 'get_data_file') as get_data_file_mock:
+            provider.initialize(EvaluationContext())
+
+        # assert
+        self.assertIsNone(provider.get_warm_up_report())
+        get_data_file_mock.assert_not_called()
+
+    def test_failed_warm_up_does_not_fail_initialize(self):
+        # arrange
+        provider = self.make_provider(warm_up=True)
+        client = provider.get_client()
+
+        # act
+        with patch.object(client, 'wait_init', return_value=True), \
+                patch.object(client, 'get_data_file', side_effect=RuntimeError('unavailable')):
+            provider.initialize(EvaluationContext())
+
+        # assert
+        self.assertEqual('unavailable', provider.get_warm_up_report().error)